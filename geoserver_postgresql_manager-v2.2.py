@@ -6,53 +6,155 @@ GeoServer & PostgreSQL 完整集成管理系统 - 修复版
 
 import sys
 import os
+import io
 import json
 import re
 import traceback
 import tempfile
 import shutil
 import zipfile
+import sqlite3
+import socket
+import importlib.util
 from pathlib import Path
 from datetime import datetime
 import xml.etree.ElementTree as ET
-from urllib.parse import quote
+from urllib.parse import quote, urlsplit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from queue import Queue
 import threading
 import time
+from contextlib import contextmanager, closing
+from dataclasses import dataclass, asdict
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Optional
+from itertools import groupby, islice
+from operator import itemgetter
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 # 核心依赖
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import psycopg2
+from psycopg2 import sql
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 
-# 空间数据处理库
+# 可选：orjson解析JSON更快，未安装时使用标准库
 try:
-    import geopandas as gpd
-    import fiona
-    import rasterio
-    from rasterio.crs import CRS
-    from shapely.geometry import Point, LineString, Polygon
-    HAS_SPATIAL_LIBS = True
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    HAS_SPATIAL_LIBS = False
-    print("警告: 缺少空间数据处理库，请安装: pip install geopandas fiona rasterio")
+    _json_loads = json.loads
+
+# 空间数据处理库（导入时初始化GDAL/PROJ较慢，启动时只检查是否安装，首次使用时再导入）
+_SPATIAL_MODULES = ("geopandas", "fiona", "pyogrio", "rasterio", "pyproj", "numpy", "shapely")
+HAS_SPATIAL_LIBS = all(importlib.util.find_spec(name) is not None for name in _SPATIAL_MODULES)
+# 可选：pyarrow可用时通过pyogrio.open_arrow分批读取矢量数据，否则使用fiona游标
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+if not HAS_SPATIAL_LIBS:
+    print("警告: 缺少空间数据处理库，请安装: pip install geopandas fiona rasterio pyogrio")
+
+_spatial_ok = None
+_spatial_lock = threading.Lock()
+
+def _ensure_spatial():
+    """首次调用时导入空间数据处理库，返回是否可用"""
+    global _spatial_ok, gpd, fiona, pyogrio, rasterio, CRS, PyCRS, Transformer, np
+    global Point, LineString, Polygon, shapely
+    if _spatial_ok is not None:
+        return _spatial_ok
+    with _spatial_lock:
+        if _spatial_ok is None:
+            try:
+                import geopandas as gpd
+                import fiona
+                import pyogrio
+                import rasterio
+                from rasterio.crs import CRS
+                from pyproj import CRS as PyCRS, Transformer
+                import numpy as np
+                from shapely.geometry import Point, LineString, Polygon
+                import shapely
+                _spatial_ok = True
+            except ImportError as e:
+                print(f"警告: 空间数据处理库导入失败: {e}")
+                _spatial_ok = False
+    return _spatial_ok
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QTreeWidget, QTreeWidgetItem, QLineEdit, QTextEdit,
+    QTabWidget, QLineEdit, QTextEdit,
     QPushButton, QLabel, QGroupBox, QComboBox, QProgressBar,
-    QMessageBox, QFileDialog, QTableWidget, QTableWidgetItem,
+    QMessageBox, QFileDialog,
     QHeaderView, QSplitter, QFormLayout, QCheckBox, QSpinBox,
     QDateEdit, QFrame, QScrollArea, QGridLayout, QRadioButton,
-    QButtonGroup, QListWidget, QDialog, QDialogButtonBox
+    QButtonGroup, QListWidget, QDialog, QDialogButtonBox, QTreeView, QTableView
 )
 from PyQt6.QtCore import (
     Qt, QThread, pyqtSignal, QTimer, QSize, QDate, QThreadPool, QRunnable, 
-    QObject, QMutex, QWaitCondition
+    QObject, QMutex, QWaitCondition, QSignalBlocker, QAbstractItemModel, QAbstractTableModel, QModelIndex
 )
 from PyQt6.QtGui import QIcon, QFont, QPixmap, QPalette, QColor, QCloseEvent
 
+# ================== 常量 ==================
+
+APP_VERSION = "2.2"
+
+# 扫描结果缓存数据库
+SCAN_CACHE_PATH = Path.home() / '.gpm2' / 'scan_cache.sqlite'
+
+# 缓存数据项的结构版本，ScanItem字段变化时递增，旧结构的缓存行自动失效
+SCAN_CACHE_SCHEMA = 3
+_SCAN_CACHE_VERSION = f"{APP_VERSION}/{SCAN_CACHE_SCHEMA}"
+
+# 字段名清理（PostgreSQL字段名只保留字母、数字和下划线）
+_COL_CLEAN_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+# 坐标系描述中的EPSG代码
+_EPSG_RE = re.compile(r'EPSG:(\d+)')
+
+# 文件扩展名分类
+_VEC_EXT = frozenset({'.shp', '.geojson', '.kml', '.gpkg', '.gml'})
+_RAS_EXT = frozenset({'.tif', '.tiff', '.img', '.jp2', '.png', '.jpg'})
+_TYPE_MAP = {**{e: "矢量数据" for e in _VEC_EXT}, **{e: "栅格数据" for e in _RAS_EXT}}
+_SPATIAL_EXT = _VEC_EXT | _RAS_EXT
+
+# 名称规范化：ASCII名称用转换表一次替换，非ASCII名称回退到正则
+_NORMALIZE_TABLE = str.maketrans({
+    c: '_' for c in map(chr, range(128)) if c not in '0123456789_abcdefghijklmnopqrstuvwxyz'
+})
+_NAME_INVALID_RE = re.compile(r'[^a-z0-9_]')
+_MULTI_US_RE = re.compile(r'_+')
+
+# 合法表名：字母开头，只含字母、数字和下划线
+_TABLE_NAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*$')
+
+# 文件大小单位
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# 已解析的目标坐标系缓存 {用户输入: pyproj.CRS}
+_TARGET_CRS_CACHE = {}
+
+# 坐标转换器缓存（按线程保存，Transformer不跨线程共享）{(源CRS, 目标CRS): Transformer}
+_TRANSFORMER_CACHE = threading.local()
+
+# GeoServer REST并发请求共用的线程池（只执行单个请求，任务内不再提交新任务）
+_REST_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='gs-rest')
+
+# pandas dtype.kind -> PostgreSQL 字段类型，其余类型按文本导入
+_PG_TYPE_MAP = {
+    'i': 'bigint',
+    'u': 'bigint',
+    'f': 'double precision',
+    'b': 'boolean',
+    'M': 'timestamp'
+}
+
 # ================== 日志配置 ==================
 
 class LogManager:
@@ -74,7 +176,11 @@ class LogManager:
         # 清除已有的处理器
         self.logger.handlers.clear()
         
-        # 添加文件处理器（轮转日志）
+        # 记录器只挂队列处理器，实际写入由后台监听线程完成
+        self._queue = Queue(-1)
+        self.logger.addHandler(QueueHandler(self._queue))
+        
+        # 文件处理器（轮转日志）
         file_handler = RotatingFileHandler(
             self.log_dir / 'application.log',
             maxBytes=10*1024*1024,  # 10MB
@@ -82,9 +188,8 @@ class LogManager:
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(self.formatter)
-        self.logger.addHandler(file_handler)
         
-        # 添加错误日志文件
+        # 错误日志文件
         error_handler = RotatingFileHandler(
             self.log_dir / 'errors.log',
             maxBytes=5*1024*1024,  # 5MB
@@ -92,16 +197,26 @@ class LogManager:
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(self.formatter)
-        self.logger.addHandler(error_handler)
         
-        # 添加控制台处理器
+        # 控制台处理器
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(self.formatter)
-        self.logger.addHandler(console_handler)
+        
+        self._listener = QueueListener(
+            self._queue, file_handler, error_handler, console_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
         
         self.logger.info("日志系统初始化完成")
     
+    def shutdown(self):
+        """停止后台日志线程并写出剩余日志"""
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
+    
     def get_logger(self, name=None):
         """获取日志记录器"""
         if name:
@@ -135,6 +250,10 @@ class SafeWorker(QObject):
     status = pyqtSignal(str)
     finished = pyqtSignal(bool, str)
     error = pyqtSignal(str)
+    result = pyqtSignal(object)
+    
+    # 状态文本最短发送间隔（秒）
+    STATUS_INTERVAL = 0.1
     
     def __init__(self, task_func, *args, **kwargs):
         super().__init__()
@@ -144,6 +263,25 @@ class SafeWorker(QObject):
         self.logger = log_manager.get_logger('SafeWorker')
         self._is_cancelled = False
         self._mutex = QMutex()
+        self._last_progress = -1
+        self._progress_lock = threading.Lock()
+        self._last_status_at = 0.0
+    
+    def report_progress(self, value):
+        """发送进度，只在数值增大时发送（多个线程交错汇报时进度不会回退）"""
+        value = int(value)
+        with self._progress_lock:
+            if value <= self._last_progress:
+                return
+            self._last_progress = value
+            self.progress.emit(value)
+    
+    def report_status(self, text, force=False):
+        """发送状态文本，间隔不足STATUS_INTERVAL时丢弃（force为True时总是发送）"""
+        now = time.monotonic()
+        if force or now - self._last_status_at >= self.STATUS_INTERVAL:
+            self._last_status_at = now
+            self.status.emit(text)
     
     def run(self):
         """运行任务"""
@@ -163,10 +301,12 @@ class SafeWorker(QObject):
                 self.finished.emit(False, "操作已取消")
                 return
             
-            if isinstance(result, tuple):
+            if isinstance(result, tuple) and len(result) == 2 and isinstance(result[0], bool):
                 success, message = result
-                self.finished.emit(success, message)
+                self.finished.emit(success, str(message))
             else:
+                # 查询类任务的返回值交给result信号，在GUI线程中处理
+                self.result.emit(result)
                 self.finished.emit(True, "操作完成")
                 
         except Exception as e:
@@ -184,64 +324,70 @@ class SafeWorker(QObject):
         with QMutex():
             return self._is_cancelled
 
+class _TaskRunnable(QRunnable):
+    """在线程池中执行SafeWorker"""
+    
+    def __init__(self, worker):
+        super().__init__()
+        self.worker = worker
+        # 由ThreadManager持有引用，避免Qt在运行结束后删除
+        self.setAutoDelete(False)
+    
+    def run(self):
+        self.worker.run()
+
+def _resolve_host(host):
+    """解析主机名以预热系统DNS缓存（失败时忽略）"""
+    try:
+        socket.getaddrinfo(host, None)
+    except OSError:
+        pass
+
 class ThreadManager(QObject):
     """线程管理器"""
     
     def __init__(self):
         super().__init__()
-        self.active_threads = []
+        self.active_tasks = []
+        # 共享线程池，复用工作线程而不是每个任务创建QThread
         self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(4)  # 最大4个并发线程
+        self.thread_pool.setMaxThreadCount(max(4, QThread.idealThreadCount()))
         self.logger = log_manager.get_logger('ThreadManager')
     
     def start_task(self, task_func, *args, **kwargs):
         """启动任务"""
         worker = SafeWorker(task_func, *args, **kwargs)
-        thread = QThread()
+        runnable = _TaskRunnable(worker)
         
-        # 移动worker到线程
-        worker.moveToThread(thread)
+        # 清理完成的任务
+        worker.finished.connect(lambda *_: self._remove_task(runnable))
         
-        # 连接信号
-        thread.started.connect(worker.run)
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
+        # 保存任务引用
+        self.active_tasks.append(runnable)
         
-        # 清理完成的线程
-        thread.finished.connect(lambda: self._remove_thread(thread))
-        
-        # 保存线程引用
-        self.active_threads.append((thread, worker))
-        
-        # 启动线程
-        thread.start()
+        # 推迟到事件循环中再提交，确保调用方先连接好信号
+        QTimer.singleShot(0, lambda: self.thread_pool.start(runnable))
         
         return worker
     
-    def _remove_thread(self, thread):
-        """移除已完成的线程"""
-        self.active_threads = [(t, w) for t, w in self.active_threads if t != thread]
+    def _remove_task(self, runnable):
+        """移除已完成的任务"""
+        self.active_tasks = [r for r in self.active_tasks if r is not runnable]
     
     def cancel_all(self):
         """取消所有活动任务"""
         self.logger.info("取消所有活动任务")
         
-        for thread, worker in self.active_threads:
-            if worker:
-                worker.cancel()
-            if thread and thread.isRunning():
-                thread.quit()
-                thread.wait(3000)  # 等待3秒
+        for runnable in self.active_tasks:
+            runnable.worker.cancel()
+        
+        # 丢弃尚未开始执行的任务
+        self.thread_pool.clear()
     
     def wait_for_all(self, timeout=10000):
         """等待所有线程完成"""
         self.logger.info("等待所有线程完成")
-        
-        for thread, worker in self.active_threads:
-            if thread and thread.isRunning():
-                thread.quit()
-                thread.wait(timeout)
+        self.thread_pool.waitForDone(timeout)
 
 # ================== 空间数据处理引擎 ==================
 
@@ -250,114 +396,144 @@ class ImprovedSpatialDataProcessor:
     
     def __init__(self):
         self.logger = log_manager.get_logger('SpatialProcessor')
-        self.temp_dir = None
+        self._temp_dir = None
         
-        if not HAS_SPATIAL_LIBS:
+        if not _ensure_spatial():
             self.logger.error("缺少必要的空间数据处理库")
-            raise ImportError("请安装空间数据处理库: pip install geopandas fiona rasterio")
+            raise ImportError("请安装空间数据处理库: pip install geopandas fiona rasterio pyogrio")
+    
+    @property
+    def temp_dir(self):
+        """临时目录（首次访问时创建）"""
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.mkdtemp(prefix='spatial_data_')
+            self.logger.debug("创建临时目录: %s", self._temp_dir)
+        return self._temp_dir
     
     def __enter__(self):
-        self.temp_dir = tempfile.mkdtemp(prefix='spatial_data_')
-        self.logger.debug(f"创建临时目录: {self.temp_dir}")
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-            self.logger.debug(f"清理临时目录: {self.temp_dir}")
+        if self._temp_dir and os.path.exists(self._temp_dir):
+            shutil.rmtree(self._temp_dir)
+            self.logger.debug("清理临时目录: %s", self._temp_dir)
+        self._temp_dir = None
+    
+    def _probe_vector(self, file_path, force=True):
+        """一次读取矢量图层元信息（几何类型、坐标系、范围、要素数量）
+        
+        force=False时只读取驱动可直接给出的范围和要素数量，不做全表扫描
+        """
+        return pyogrio.read_info(file_path, force_feature_count=force, force_total_bounds=force)
+    
+    def _probe_raster(self, file_path):
+        """一次打开栅格文件读取全部元信息"""
+        with rasterio.open(file_path) as src:
+            return {
+                'crs': src.crs,
+                'bounds': src.bounds,
+                'count': src.count,
+                'width': src.width,
+                'height': src.height,
+                'dtype': str(src.dtypes[0])
+            }
+    
+    def _raster_extent(self, bounds):
+        """栅格范围转换为字典"""
+        return {
+            'minx': float(bounds.left),
+            'miny': float(bounds.bottom),
+            'maxx': float(bounds.right),
+            'maxy': float(bounds.top)
+        }
+    
+    def _epsg_from_crs(self, crs_info):
+        """从坐标系对象或描述字符串中提取EPSG代码"""
+        if not crs_info:
+            return None
+        
+        # 优先使用结构化接口（rasterio/fiona/pyproj的CRS对象）
+        to_epsg = getattr(crs_info, 'to_epsg', None)
+        if to_epsg is not None:
+            epsg = to_epsg()
+            if epsg:
+                return f"EPSG:{epsg}"
+        
+        match = _EPSG_RE.search(str(crs_info))
+        if match:
+            return f"EPSG:{match.group(1)}"
+        return None
     
     def detect_geometry_type(self, file_path):
-        """检测几何类型"""
+        """检测几何类型（已弃用，请使用get_file_info）"""
         try:
-            self.logger.debug(f"检测几何类型: {file_path}")
-            
-            # 使用fiona读取文件信息
-            with fiona.open(file_path) as src:
-                if src.schema and 'geometry' in src.schema:
-                    geom_type = src.schema['geometry']
-                    self.logger.info(f"检测到几何类型: {geom_type}")
-                    return geom_type.upper()
+            self.logger.debug("检测几何类型: %s", file_path)
+            
+            # 使用pyogrio读取图层元信息
+            info = pyogrio.read_info(file_path)
+            geom_type = info.get('geometry_type')
+            if geom_type:
+                self.logger.info("检测到几何类型: %s", geom_type)
+                return geom_type.upper()
                     
         except Exception as e:
-            self.logger.warning(f"检测几何类型失败: {e}")
+            self.logger.warning("检测几何类型失败: %s", e)
             
         return 'GEOMETRY'  # 默认值
     
     def detect_crs(self, file_path):
-        """检测坐标参考系统"""
+        """检测坐标参考系统（已弃用，请使用get_file_info）"""
         try:
-            self.logger.debug(f"检测坐标系: {file_path}")
+            self.logger.debug("检测坐标系: %s", file_path)
             
             file_ext = Path(file_path).suffix.lower()
             
             if file_ext in ['.shp', '.geojson', '.gpkg']:
                 # 矢量数据
-                with fiona.open(file_path) as src:
-                    if src.crs:
-                        # 转换为EPSG代码
-                        crs_info = src.crs
-                        if 'init' in crs_info:
-                            epsg_code = crs_info['init']
-                            self.logger.info(f"检测到坐标系: {epsg_code}")
-                            return epsg_code.upper()
-                        elif 'EPSG' in str(crs_info):
-                            # 从字符串中提取EPSG代码
-                            match = re.search(r'EPSG:(\d+)', str(crs_info))
-                            if match:
-                                epsg_code = f"EPSG:{match.group(1)}"
-                                self.logger.info(f"检测到坐标系: {epsg_code}")
-                                return epsg_code
+                epsg_code = self._epsg_from_crs(pyogrio.read_info(file_path).get('crs'))
+                if epsg_code:
+                    self.logger.info("检测到坐标系: %s", epsg_code)
+                    return epsg_code
                                 
             elif file_ext in ['.tif', '.tiff']:
                 # 栅格数据
-                with rasterio.open(file_path) as src:
-                    if src.crs:
-                        crs = CRS.from_wkt(src.crs.to_wkt())
-                        if crs.to_epsg():
-                            epsg_code = f"EPSG:{crs.to_epsg()}"
-                            self.logger.info(f"检测到坐标系: {epsg_code}")
-                            return epsg_code
+                epsg_code = self._epsg_from_crs(self._probe_raster(file_path)['crs'])
+                if epsg_code:
+                    self.logger.info("检测到坐标系: %s", epsg_code)
+                    return epsg_code
                             
         except Exception as e:
-            self.logger.warning(f"坐标系检测失败: {e}")
+            self.logger.warning("坐标系检测失败: %s", e)
             
         return "EPSG:4326"  # 默认值
     
     def get_data_extent(self, file_path):
-        """获取数据范围"""
+        """获取数据范围（已弃用，请使用get_file_info）"""
         try:
-            self.logger.debug(f"获取数据范围: {file_path}")
+            self.logger.debug("获取数据范围: %s", file_path)
             
             file_ext = Path(file_path).suffix.lower()
             
             if file_ext in ['.shp', '.geojson', '.gpkg']:
-                # 矢量数据
-                gdf = gpd.read_file(file_path)
-                bounds = gdf.total_bounds
+                # 矢量数据，只读取元信息不加载几何
+                bounds = pyogrio.read_info(file_path, force_total_bounds=True)['total_bounds']
                 extent = {
                     'minx': float(bounds[0]),
                     'miny': float(bounds[1]),
                     'maxx': float(bounds[2]),
                     'maxy': float(bounds[3])
                 }
-                self.logger.info(f"数据范围: {extent}")
+                self.logger.info("数据范围: %s", extent)
                 return extent
                 
             elif file_ext in ['.tif', '.tiff']:
                 # 栅格数据
-                with rasterio.open(file_path) as src:
-                    bounds = src.bounds
-                    extent = {
-                        'minx': float(bounds.left),
-                        'miny': float(bounds.bottom),
-                        'maxx': float(bounds.right),
-                        'maxy': float(bounds.top)
-                    }
-                    self.logger.info(f"数据范围: {extent}")
-                    return extent
+                extent = self._raster_extent(self._probe_raster(file_path)['bounds'])
+                self.logger.info("数据范围: %s", extent)
+                return extent
                     
         except Exception as e:
-            self.logger.warning(f"获取数据范围失败: {e}")
+            self.logger.warning("获取数据范围失败: %s", e)
             
         return None
     
@@ -371,15 +547,21 @@ class ImprovedSpatialDataProcessor:
         except:
             return False
     
-    def get_file_info(self, file_path):
+    def get_file_info_fast(self, file_path, file_size=None):
+        """快速获取文件信息（只读文件头，范围/要素数量不可直接获得时为None）"""
+        return self.get_file_info(file_path, fast=True, file_size=file_size)
+    
+    def get_file_info(self, file_path, fast=False, file_size=None):
         """获取文件完整信息"""
         try:
-            file_ext = Path(file_path).suffix.lower()
-            file_size = os.path.getsize(file_path)
+            path = Path(file_path)
+            file_ext = path.suffix.lower()
+            if file_size is None:
+                file_size = os.path.getsize(file_path)
             
             info = {
                 'path': file_path,
-                'name': Path(file_path).stem,
+                'name': path.stem,
                 'extension': file_ext,
                 'size': file_size,
                 'size_formatted': self.format_file_size(file_size),
@@ -391,81 +573,104 @@ class ImprovedSpatialDataProcessor:
             }
             
             if file_ext in ['.shp', '.geojson', '.gpkg']:
-                # 矢量数据详细信息
-                info['geometry_type'] = self.detect_geometry_type(file_path)
-                info['crs'] = self.detect_crs(file_path)
-                info['extent'] = self.get_data_extent(file_path)
+                # 矢量数据详细信息，一次读取全部元信息
+                info['geometry_type'] = 'GEOMETRY'
+                info['crs'] = "EPSG:4326"
                 
-                # 获取要素数量
                 try:
-                    gdf = gpd.read_file(file_path)
-                    info['feature_count'] = len(gdf)
-                except:
-                    pass
+                    vector_info = self._probe_vector(file_path, force=not fast)
+                    
+                    geom_type = vector_info.get('geometry_type')
+                    if geom_type:
+                        info['geometry_type'] = geom_type.upper()
+                    
+                    info['crs'] = self._epsg_from_crs(vector_info.get('crs')) or info['crs']
+                    
+                    bounds = vector_info.get('total_bounds')
+                    if bounds is not None:
+                        info['extent'] = {
+                            'minx': float(bounds[0]),
+                            'miny': float(bounds[1]),
+                            'maxx': float(bounds[2]),
+                            'maxy': float(bounds[3])
+                        }
+                    
+                    feature_count = vector_info.get('features', -1)
+                    if feature_count >= 0:
+                        info['feature_count'] = int(feature_count)
+                except Exception as e:
+                    self.logger.warning("读取矢量信息失败: %s", e)
                     
             elif file_ext in ['.tif', '.tiff']:
-                # 栅格数据详细信息
-                info['crs'] = self.detect_crs(file_path)
-                info['extent'] = self.get_data_extent(file_path)
+                # 栅格数据详细信息，只打开一次文件
+                info['crs'] = "EPSG:4326"
                 
                 try:
-                    with rasterio.open(file_path) as src:
-                        info['bands'] = src.count
-                        info['width'] = src.width
-                        info['height'] = src.height
-                        info['dtype'] = str(src.dtypes[0])
-                except:
-                    pass
+                    raster_info = self._probe_raster(file_path)
+                    info['crs'] = self._epsg_from_crs(raster_info['crs']) or info['crs']
+                    info['extent'] = self._raster_extent(raster_info['bounds'])
+                    info['bands'] = raster_info['count']
+                    info['width'] = raster_info['width']
+                    info['height'] = raster_info['height']
+                    info['dtype'] = raster_info['dtype']
+                except Exception as e:
+                    self.logger.warning("读取栅格信息失败: %s", e)
             
             return info
             
         except Exception as e:
-            self.logger.error(f"获取文件信息失败 {file_path}: {e}")
+            self.logger.error("获取文件信息失败 %s: %s", file_path, e)
             return None
     
     def get_data_type(self, file_ext):
         """根据文件扩展名判断数据类型"""
-        vector_extensions = {'.shp', '.geojson', '.kml', '.gpkg', '.gml'}
-        raster_extensions = {'.tif', '.tiff', '.img', '.jp2', '.png', '.jpg'}
-        
-        if file_ext in vector_extensions:
-            return "矢量数据"
-        elif file_ext in raster_extensions:
-            return "栅格数据"
-        else:
-            return "未知类型"
+        return _TYPE_MAP.get(file_ext, "未知类型")
     
     def format_file_size(self, size_bytes):
         """格式化文件大小"""
-        if size_bytes == 0:
+        if size_bytes <= 0:
             return "0 B"
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        import math
-        i = int(math.floor(math.log(size_bytes, 1024)))
-        p = math.pow(1024, i)
-        s = round(size_bytes / p, 2)
-        return f"{s} {size_names[i]}"
+        i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        s = round(size_bytes / (1 << (10 * i)), 2)
+        return f"{s} {_SIZE_UNITS[i]}"
 
 class ImprovedPostgreSQLManager:
     """改进的PostgreSQL数据管理器"""
     
-    def __init__(self, connection_params):
+    # PostGIS扩展检查结果缓存 {(host, port, database): bool}
+    _postgis_cache = {}
+    
+    # 表列表缓存 {(host, port, database): (时间戳, 结果)}
+    # 本程序的写操作都会主动失效缓存，刷新后紧接着扫描可直接命中
+    _tables_cache = {}
+    TABLES_CACHE_TTL = 30.0
+    
+    def __init__(self, connection_params, maxconn=20):
         self.params = connection_params
-        self.connection = None
+        self.maxconn = maxconn
+        self.pool = None
         self.logger = log_manager.get_logger('PostgreSQLManager')
+    
+    def _postgis_key(self):
+        """PostGIS检查缓存键"""
+        return (self.params['host'], self.params['port'], self.params['database'])
         
     def connect(self):
-        """建立连接"""
+        """建立连接池"""
         try:
             self.logger.info(f"尝试连接PostgreSQL: {self.params['host']}:{self.params['port']}")
-            self.connection = psycopg2.connect(**self.params)
-            self.connection.autocommit = False
-            
-            # 检查PostGIS扩展
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname='postgis')")
-            has_postgis = cursor.fetchone()[0]
-            cursor.close()
+            if self.pool is None or self.pool.closed:
+                self.pool = ThreadedConnectionPool(1, self.maxconn, **self.params)
+            
+            # 检查PostGIS扩展（同一数据库只检查一次）
+            key = self._postgis_key()
+            has_postgis = self._postgis_cache.get(key)
+            if has_postgis is None:
+                with self._conn(readonly=True) as conn:
+                    with conn.cursor() as cursor:
+                        cursor.execute("SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname='postgis')")
+                        has_postgis = cursor.fetchone()[0]
+                self._postgis_cache[key] = has_postgis
             
             if not has_postgis:
                 self.logger.warning("PostGIS扩展未安装")
@@ -475,23 +680,49 @@ class ImprovedPostgreSQLManager:
             return True, "连接成功"
             
         except Exception as e:
+            self._postgis_cache.pop(self._postgis_key(), None)
             self.logger.error(f"数据库连接失败: {e}")
             return False, str(e)
     
+    def refresh_postgis_status(self):
+        """清除PostGIS检查缓存并重新检查"""
+        self._postgis_cache.pop(self._postgis_key(), None)
+        return self.connect()
+    
+    def close(self):
+        """关闭连接池"""
+        if self.pool is not None and not self.pool.closed:
+            self.pool.closeall()
+        self.pool = None
+    
+    @contextmanager
+    def _conn(self, readonly=False):
+        """从连接池借用连接，用完归还（未提交的事务由连接池回滚）
+        
+        readonly=True时使用自动提交，只读查询不产生BEGIN/ROLLBACK往返
+        """
+        conn = self.pool.getconn()
+        try:
+            if readonly:
+                conn.autocommit = True
+            yield conn
+        finally:
+            if readonly and not conn.closed:
+                conn.autocommit = False
+            self.pool.putconn(conn)
+    
     def check_table_exists(self, table_name, schema='public'):
         """检查表是否存在"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT EXISTS (
-                    SELECT 1 FROM information_schema.tables 
-                    WHERE table_schema = %s AND table_name = %s
-                )
-            """, (schema, table_name))
-            
-            exists = cursor.fetchone()[0]
-            cursor.close()
-            return exists
+            with self._conn(readonly=True) as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT EXISTS (
+                            SELECT 1 FROM information_schema.tables 
+                            WHERE table_schema = %s AND table_name = %s
+                        )
+                    """, (schema, table_name))
+                    return cursor.fetchone()[0]
             
         except Exception as e:
             self.logger.error(f"检查表存在性失败: {e}")
@@ -500,20 +731,126 @@ class ImprovedPostgreSQLManager:
     def drop_table_if_exists(self, table_name, schema='public'):
         """删除表（如果存在）"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(f'DROP TABLE IF EXISTS "{schema}"."{table_name}" CASCADE')
-            self.connection.commit()
-            cursor.close()
+            with self._conn() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(f'DROP TABLE IF EXISTS "{schema}"."{table_name}" CASCADE')
+                conn.commit()
+            self.invalidate_tables_cache()
             self.logger.info(f"删除表: {schema}.{table_name}")
             return True
         except Exception as e:
             self.logger.error(f"删除表失败: {e}")
-            self.connection.rollback()
             return False
     
     def import_geodataframe_to_postgis(self, gdf, table_name, schema='public', 
-                                     if_exists='replace', index=False):
-        """将GeoDataFrame导入到PostGIS"""
+                                     if_exists='replace', index=False,
+                                     use_copy=True, cluster=True, batch_size=50000):
+        """将GeoDataFrame导入到PostGIS（默认COPY批量写入，use_copy=False时使用to_postgis）
+        
+        COPY按batch_size行分批序列化，避免一次生成整表CSV；各批在同一事务内写入。
+        """
+        if not use_copy:
+            return self._import_geodataframe_legacy(gdf, table_name, schema, if_exists, index)
+        
+        try:
+            if index:
+                gdf = gdf.reset_index()
+            
+            geom_col = gdf.geometry.name
+            srid = gdf.crs.to_epsg() if gdf.crs else None
+            srid = srid or 0
+            
+            # 几何类型：单一类型使用具体类型，混合类型使用GEOMETRY
+            geom_types = gdf.geom_type.dropna().unique()
+            geom_type = geom_types[0].upper() if len(geom_types) == 1 else 'GEOMETRY'
+            if gdf.has_z.any():
+                geom_type += 'Z'
+            
+            table = sql.Identifier(schema, table_name)
+            
+            # 属性列 + 十六进制EWKB几何列，按CSV格式写入缓冲区
+            frame = gdf.drop(columns=geom_col)
+            column_defs = self._column_defs(frame)
+            column_defs.append(sql.SQL("{} geometry({}, {})").format(
+                sql.Identifier(geom_col), sql.SQL(geom_type), sql.Literal(srid)
+            ))
+            
+            # 一次向量化调用生成全部EWKB（空几何保持为None，写入NULL）
+            geoms = shapely.set_srid(gdf.geometry.to_numpy(), srid)
+            frame[geom_col] = shapely.to_wkb(geoms, hex=True, include_srid=True)
+            batch_size = max(1, int(batch_size))
+            
+            index_name = f"idx_{table_name}_{geom_col}"
+            
+            with self._conn() as conn:
+                with conn.cursor() as cursor:
+                    if if_exists == 'replace':
+                        cursor.execute(sql.SQL("DROP TABLE IF EXISTS {} CASCADE").format(table))
+                    create = "CREATE TABLE IF NOT EXISTS {} ({})" if if_exists == 'append' else "CREATE TABLE {} ({})"
+                    cursor.execute(sql.SQL(create).format(table, sql.SQL(', ').join(column_defs)))
+                    
+                    # 追加数据时先删除空间索引，避免COPY过程中逐行维护索引
+                    if if_exists == 'append':
+                        cursor.execute(sql.SQL("DROP INDEX IF EXISTS {}").format(
+                            sql.Identifier(schema, index_name)
+                        ))
+                    
+                    copy_sql = self._copy_sql(cursor, table, frame.columns)
+                    for start in range(0, len(frame), batch_size):
+                        self._copy_frame(cursor, copy_sql, frame.iloc[start:start + batch_size])
+                    
+                    self._finish_geo_table(cursor, table, index_name, geom_col, cluster)
+                conn.commit()
+            self.invalidate_tables_cache()
+            self.logger.info(f"创建空间索引: {index_name}")
+            
+            self.logger.info(f"成功导入GeoDataFrame到表: {schema}.{table_name}")
+            return True, "导入成功"
+            
+        except Exception as e:
+            self.logger.error(f"导入GeoDataFrame失败: {e}")
+            return False, str(e)
+    
+    @staticmethod
+    def _column_defs(frame):
+        """按DataFrame的dtype生成属性列定义"""
+        return [
+            sql.SQL("{} {}").format(
+                sql.Identifier(col), sql.SQL(_PG_TYPE_MAP.get(dtype.kind, 'text'))
+            )
+            for col, dtype in frame.dtypes.items()
+        ]
+    
+    @staticmethod
+    def _copy_sql(cursor, table, columns):
+        """生成CSV格式的COPY语句"""
+        return sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+            table, sql.SQL(', ').join(map(sql.Identifier, columns))
+        ).as_string(cursor)
+    
+    @staticmethod
+    def _copy_frame(cursor, copy_sql, frame):
+        """将一批数据序列化为CSV并COPY写入"""
+        buffer = io.StringIO()
+        frame.to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+        cursor.copy_expert(copy_sql, buffer)
+    
+    @staticmethod
+    def _finish_geo_table(cursor, table, index_name, geom_col, cluster=True):
+        """数据写入后在同一事务内重建空间索引、按索引聚簇并更新统计信息（一次往返）"""
+        statements = [sql.SQL("CREATE INDEX {idx} ON {tbl} USING GIST ({geom})")]
+        if cluster:
+            statements.append(sql.SQL("CLUSTER {tbl} USING {idx}"))
+        statements.append(sql.SQL("ANALYZE {tbl}"))
+        cursor.execute(sql.SQL("; ").join(
+            st.format(idx=sql.Identifier(index_name), tbl=table, geom=sql.Identifier(geom_col))
+            for st in statements
+        ))
+    
+    def _import_geodataframe_legacy(self, gdf, table_name, schema='public',
+                                    if_exists='replace', index=False):
+        """使用geopandas的to_postgis导入（旧方式）"""
         try:
             # 构建连接字符串
             engine_string = (
@@ -521,7 +858,6 @@ class ImprovedPostgreSQLManager:
                 f"@{self.params['host']}:{self.params['port']}/{self.params['database']}"
             )
             
-            # 使用geopandas的to_postgis方法
             gdf.to_postgis(
                 table_name,
                 engine_string,
@@ -529,9 +865,10 @@ class ImprovedPostgreSQLManager:
                 if_exists=if_exists,
                 index=index
             )
+            self.invalidate_tables_cache()
             
             # 创建空间索引
-            self.create_spatial_index(table_name, schema)
+            self.create_spatial_index(table_name, schema, gdf.geometry.name)
             
             self.logger.info(f"成功导入GeoDataFrame到表: {schema}.{table_name}")
             return True, "导入成功"
@@ -540,63 +877,264 @@ class ImprovedPostgreSQLManager:
             self.logger.error(f"导入GeoDataFrame失败: {e}")
             return False, str(e)
     
+    def _get_target_crs(self, target_crs):
+        """解析目标坐标系（按输入字符串缓存）"""
+        crs = _TARGET_CRS_CACHE.get(target_crs)
+        if crs is None:
+            crs = _TARGET_CRS_CACHE[target_crs] = PyCRS.from_user_input(target_crs)
+        return crs
+    
+    @staticmethod
+    def _get_transformer(src_crs, dst_crs):
+        """获取源/目标坐标系之间的转换器（每个线程按坐标系对缓存，避免重复构建PROJ管道）"""
+        cache = getattr(_TRANSFORMER_CACHE, 'transformers', None)
+        if cache is None:
+            cache = _TRANSFORMER_CACHE.transformers = {}
+        key = (src_crs, dst_crs)
+        transformer = cache.get(key)
+        if transformer is None:
+            transformer = cache[key] = Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+        return transformer
+    
+    def _reproject(self, gdf, target):
+        """整列批量转换坐标（一次性转换全部坐标数组）"""
+        transformer = self._get_transformer(gdf.crs, target)
+        
+        def transform_coords(coords):
+            return np.column_stack(transformer.transform(*coords.T))
+        
+        geoms = shapely.transform(
+            gdf.geometry.to_numpy(), transform_coords, include_z=bool(gdf.has_z.any())
+        )
+        return gdf.assign(**{gdf.geometry.name: gpd.GeoSeries(geoms, index=gdf.index, crs=target)})
+    
+    def _prepare_vector_frame(self, gdf, target, target_crs, log=True):
+        """去除空几何、转换坐标系，并规范几何列名和字段名"""
+        # 去除空几何（一次向量化判断），避免后续建立空间索引出错
+        empty_mask = shapely.is_empty(gdf.geometry.to_numpy())
+        if empty_mask.any():
+            if log:
+                self.logger.info("去除空几何要素: %s 个", int(empty_mask.sum()))
+            gdf = gdf[~empty_mask]
+        
+        # 转换坐标系（使用已解析的目标坐标系，避免重复解析字符串）
+        if gdf.crs is None:
+            if log:
+                self.logger.warning("文件没有坐标系信息，假设为: %s", target_crs)
+            gdf = gdf.set_crs(target)
+        elif not gdf.crs.equals(target):
+            if log:
+                self.logger.info("坐标系转换: %s -> %s", gdf.crs, target_crs)
+            gdf = self._reproject(gdf, target)
+        
+        # 确保几何列名为'geom'
+        if gdf.geometry.name != 'geom':
+            gdf = gdf.rename_geometry('geom')
+        
+        # 处理字段名（PostgreSQL要求小写）
+        non_geom = gdf.columns.drop('geom')
+        clean_cols = non_geom.str.lower().str.replace(_COL_CLEAN_RE, '_', regex=True)
+        return gdf.rename(columns=dict(zip(non_geom, clean_cols)))
+    
+    @staticmethod
+    def _iter_vector_batches(file_path, batch_size):
+        """只打开一次数据源，按batch_size个要素依次产出GeoDataFrame"""
+        if HAS_PYARROW:
+            with pyogrio.open_arrow(file_path, batch_size=batch_size, use_pyarrow=True) as (meta, reader):
+                geom_col = meta['geometry_name'] or 'wkb_geometry'
+                for batch in reader:
+                    frame = batch.to_pandas()
+                    geoms = shapely.from_wkb(frame.pop(geom_col).to_numpy())
+                    yield gpd.GeoDataFrame(frame, geometry=geoms, crs=meta['crs'])
+        else:
+            with fiona.open(file_path) as src:
+                crs = src.crs_wkt or None
+                features = iter(src)
+                while batch := list(islice(features, batch_size)):
+                    yield gpd.GeoDataFrame.from_features(batch, crs=crs)
+    
+    def _copy_vector_file(self, file_path, table_name, schema, target, target_crs,
+                          overwrite=True, batch_size=50000, cluster=False,
+                          progress_callback=None, is_cancelled=None):
+        """按batch_size个要素分批读取矢量文件并COPY写入，内存占用与文件大小无关
+        
+        首批数据决定属性列；几何列建为geometry(GEOMETRY, srid)，写入后不再改列类型，
+        大表默认也不CLUSTER，避免额外重写整表。
+        每批写入后调用progress_callback(已处理要素数, 要素总数)，驱动无法直接给出要素数时
+        总数为None；is_cancelled()为True时回滚整个导入。
+        返回 (成功, 消息, 导入信息)，导入信息见import_vector_file_with_info。
+        """
+        batch_size = max(1, int(batch_size))
+        # 只取驱动可直接给出的要素数，不为计数再扫描一遍文件
+        layer_info = pyogrio.read_info(file_path)
+        total = layer_info['features']
+        if total < 0:
+            total = None
+        # 图层声明为三维时几何列带Z，否则以首批数据为准
+        layer_z = 'Z' in (layer_info.get('geometry_type') or '').upper().split()
+        srid = target.to_epsg() or 0
+        table = sql.Identifier(schema, table_name)
+        index_name = f"idx_{table_name}_geom"
+        
+        written = 0
+        geom_types = set()
+        has_z = None
+        bounds = np.full(4, np.nan)
+        copy_sql = None
+        int_cols = ()
+        with self._conn() as conn:
+            with conn.cursor() as cursor:
+                if overwrite:
+                    cursor.execute(sql.SQL("DROP TABLE IF EXISTS {} CASCADE").format(table))
+                    created = True
+                else:
+                    cursor.execute("SELECT to_regclass(%s) IS NULL",
+                                   (table.as_string(cursor),))
+                    created = cursor.fetchone()[0]
+                
+                read_count = 0
+                with closing(self._iter_vector_batches(file_path, batch_size)) as batches:
+                    for gdf in batches:
+                        if is_cancelled and is_cancelled():
+                            conn.rollback()
+                            return False, "操作已取消", None
+                        
+                        first = read_count == 0
+                        read_count += len(gdf)
+                        gdf = self._prepare_vector_frame(gdf, target, target_crs, log=first)
+                        if len(gdf) == 0:
+                            if progress_callback:
+                                progress_callback(read_count, total)
+                            continue
+                        
+                        geom_types.update(gdf.geom_type.dropna().unique())
+                        frame = gdf.drop(columns='geom')
+                        
+                        if copy_sql is None:
+                            has_z = layer_z or bool(gdf.has_z.any())
+                            column_defs = self._column_defs(frame)
+                            column_defs.append(sql.SQL("geom geometry({}, {})").format(
+                                sql.SQL('GEOMETRYZ' if has_z else 'GEOMETRY'), sql.Literal(srid)
+                            ))
+                            cursor.execute(sql.SQL("CREATE TABLE IF NOT EXISTS {} ({})").format(
+                                table, sql.SQL(', ').join(column_defs)
+                            ))
+                            # 追加数据时先删除空间索引，避免COPY过程中逐行维护索引
+                            if not created:
+                                cursor.execute(sql.SQL("DROP INDEX IF EXISTS {}").format(
+                                    sql.Identifier(schema, index_name)
+                                ))
+                            int_cols = [col for col, dtype in frame.dtypes.items() if dtype.kind in 'iu']
+                            copy_sql = self._copy_sql(cursor, table, list(frame.columns) + ['geom'])
+                        
+                        # 后续批次中含空值的整数列会读成浮点数，转回可空整数以匹配表结构
+                        for col in int_cols:
+                            if frame[col].dtype.kind == 'f':
+                                frame[col] = frame[col].astype('Int64')
+                        
+                        # 维度与几何列保持一致（列类型不再事后修改）
+                        geoms = gdf.geometry.to_numpy()
+                        batch_z = shapely.has_z(geoms)
+                        if has_z and not batch_z.all():
+                            geoms = shapely.force_3d(geoms)
+                        elif not has_z and batch_z.any():
+                            geoms = shapely.force_2d(geoms)
+                        geoms = shapely.set_srid(geoms, srid)
+                        batch_bounds = shapely.total_bounds(geoms)
+                        bounds[:2] = np.fmin(bounds[:2], batch_bounds[:2])
+                        bounds[2:] = np.fmax(bounds[2:], batch_bounds[2:])
+                        frame['geom'] = shapely.to_wkb(geoms, hex=True, include_srid=True)
+                        self._copy_frame(cursor, copy_sql, frame)
+                        written += len(frame)
+                        
+                        if progress_callback:
+                            progress_callback(read_count, total)
+                
+                if not geom_types:
+                    conn.rollback()
+                    return False, "文件中没有几何数据", None
+                
+                self._finish_geo_table(cursor, table, index_name, 'geom', cluster)
+            conn.commit()
+        self.invalidate_tables_cache()
+        return True, "导入成功", self._import_info(written, srid, bounds)
+    
+    @staticmethod
+    def _import_info(count, srid, bounds):
+        """汇总导入结果：要素数、SRID和数据范围（范围无效时为None）"""
+        extent = None
+        if not np.isnan(bounds).any():
+            extent = dict(zip(('minx', 'miny', 'maxx', 'maxy'), map(float, bounds)))
+        return {'count': count, 'srid': srid, 'extent': extent}
+    
     def import_vector_file(self, file_path, table_name, schema='public', 
-                          target_crs='EPSG:4326', overwrite=True):
-        """导入矢量文件到PostGIS"""
+                          target_crs='EPSG:4326', overwrite=True, use_copy=True,
+                          batch_size=50000, progress_callback=None, is_cancelled=None):
+        """导入矢量文件到PostGIS（use_copy为True时分批流式读取和写入）"""
+        return self.import_vector_file_with_info(
+            file_path, table_name, schema, target_crs, overwrite, use_copy, batch_size,
+            progress_callback, is_cancelled
+        )[:2]
+    
+    def import_vector_file_with_info(self, file_path, table_name, schema='public',
+                                     target_crs='EPSG:4326', overwrite=True, use_copy=True,
+                                     batch_size=50000, progress_callback=None, is_cancelled=None):
+        """导入矢量文件，返回 (成功, 消息, 导入信息)
+        
+        导入信息为 {'count': 要素数, 'srid': 表的SRID, 'extent': 导入后的数据范围}，
+        失败时为None。发布时可直接使用，不必再向数据库或GeoServer查询表信息。
+        progress_callback和is_cancelled只用于分批导入（use_copy=True），见_copy_vector_file。
+        """
+        # 空间数据处理库按需导入，不依赖调用方事先加载
+        if not _ensure_spatial():
+            return False, "缺少空间数据处理库，无法导入矢量数据", None
         try:
             self.logger.info(f"开始导入矢量文件: {file_path} -> {schema}.{table_name}")
+            target = self._get_target_crs(target_crs)
             
-            # 读取矢量数据
-            gdf = gpd.read_file(file_path)
-            
-            # 检查是否有几何列
-            if gdf.geometry.empty:
-                return False, "文件中没有几何数据"
-            
-            # 转换坐标系
-            if gdf.crs is None:
-                self.logger.warning(f"文件没有坐标系信息，假设为: {target_crs}")
-                gdf.set_crs(target_crs, inplace=True)
-            elif str(gdf.crs) != target_crs:
-                self.logger.info(f"坐标系转换: {gdf.crs} -> {target_crs}")
-                gdf = gdf.to_crs(target_crs)
-            
-            # 确保几何列名为'geom'
-            if gdf.geometry.name != 'geom':
-                gdf = gdf.rename_geometry('geom')
-            
-            # 处理字段名（PostgreSQL要求小写）
-            column_mapping = {}
-            for col in gdf.columns:
-                if col != 'geom':
-                    clean_col = re.sub(r'[^a-zA-Z0-9_]', '_', col.lower())
-                    column_mapping[col] = clean_col
-            
-            if column_mapping:
-                gdf = gdf.rename(columns=column_mapping)
-            
-            # 检查表是否存在
-            if overwrite and self.check_table_exists(table_name, schema):
-                self.drop_table_if_exists(table_name, schema)
-            
-            # 导入到PostGIS
-            if_exists = 'replace' if overwrite else 'append'
-            success, message = self.import_geodataframe_to_postgis(
-                gdf, table_name, schema, if_exists
-            )
+            if use_copy:
+                success, message, info = self._copy_vector_file(
+                    file_path, table_name, schema, target, target_crs,
+                    overwrite=overwrite, batch_size=batch_size,
+                    progress_callback=progress_callback, is_cancelled=is_cancelled
+                )
+            else:
+                # 读取矢量数据
+                gdf = gpd.read_file(file_path, engine="pyogrio")
+                
+                # 检查是否有几何数据
+                if len(gdf) == 0 or not gdf.geometry.notna().any():
+                    return False, "文件中没有几何数据", None
+                
+                gdf = self._prepare_vector_frame(gdf, target, target_crs)
+                if len(gdf) == 0:
+                    return False, "文件中没有几何数据", None
+                
+                # 检查表是否存在
+                if overwrite and self.check_table_exists(table_name, schema):
+                    self.drop_table_if_exists(table_name, schema)
+                
+                # 导入到PostGIS
+                if_exists = 'replace' if overwrite else 'append'
+                success, message = self.import_geodataframe_to_postgis(
+                    gdf, table_name, schema, if_exists, use_copy=False
+                )
+                info = self._import_info(
+                    len(gdf), target.to_epsg() or 0, shapely.total_bounds(gdf.geometry.to_numpy())
+                ) if success else None
             
             if success:
                 log_manager.log_operation(
                     f"导入矢量文件", 
-                    f"{file_path} -> {schema}.{table_name}, {len(gdf)} 个要素",
+                    f"{file_path} -> {schema}.{table_name}, {info['count']} 个要素",
                     True
                 )
             
-            return success, message
+            return success, message, info
             
         except Exception as e:
             log_manager.log_exception(f"导入矢量文件", e)
-            return False, str(e)
+            return False, str(e), None
     
     def import_raster_file(self, file_path, table_name, schema='public', 
                           target_crs='EPSG:4326', overwrite=True):
@@ -616,29 +1154,29 @@ class ImprovedPostgreSQLManager:
     def create_spatial_index(self, table_name, schema='public', geom_column='geom'):
         """创建空间索引"""
         try:
-            cursor = self.connection.cursor()
             index_name = f"idx_{table_name}_{geom_column}"
-            cursor.execute(f'''
-                CREATE INDEX IF NOT EXISTS "{index_name}" 
-                ON "{schema}"."{table_name}" 
-                USING GIST ("{geom_column}")
-            ''')
-            self.connection.commit()
-            cursor.close()
+            with self._conn() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(f'''
+                        CREATE INDEX IF NOT EXISTS "{index_name}" 
+                        ON "{schema}"."{table_name}" 
+                        USING GIST ("{geom_column}")
+                    ''')
+                conn.commit()
             self.logger.info(f"创建空间索引: {index_name}")
             return True
         except Exception as e:
             self.logger.error(f"创建空间索引失败: {e}")
-            self.connection.rollback()
             return False
     
     def rename_table(self, old_name, new_name, schema='public'):
         """重命名表"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(f'ALTER TABLE "{schema}"."{old_name}" RENAME TO "{new_name}"')
-            self.connection.commit()
-            cursor.close()
+            with self._conn() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(f'ALTER TABLE "{schema}"."{old_name}" RENAME TO "{new_name}"')
+                conn.commit()
+            self.invalidate_tables_cache()
             
             log_manager.log_operation(
                 "重命名表", 
@@ -649,91 +1187,117 @@ class ImprovedPostgreSQLManager:
             
         except Exception as e:
             log_manager.log_exception("重命名表", e)
-            self.connection.rollback()
             return False, str(e)
     
     def get_spatial_tables(self):
         """获取空间数据表"""
-        if not self.connection:
-            return []
-            
-        try:
-            cursor = self.connection.cursor(cursor_factory=RealDictCursor)
-            cursor.execute("""
-                SELECT 
-                    t.table_schema,
-                    t.table_name,
-                    g.f_geometry_column,
-                    g.type as geometry_type,
-                    g.srid,
-                    pg_size_pretty(pg_total_relation_size(quote_ident(t.table_schema)||'.'||quote_ident(t.table_name))) as table_size,
-                    (SELECT COUNT(*) FROM information_schema.columns 
-                     WHERE table_schema = t.table_schema AND table_name = t.table_name) as column_count
-                FROM information_schema.tables t
-                JOIN geometry_columns g ON t.table_name = g.f_table_name 
-                    AND t.table_schema = g.f_table_schema
-                WHERE t.table_type = 'BASE TABLE'
-                    AND t.table_schema NOT IN ('information_schema', 'pg_catalog')
-                ORDER BY t.table_schema, t.table_name
-            """)
-            
-            tables = cursor.fetchall()
-            cursor.close()
-            return tables
-            
-        except Exception as e:
-            self.logger.error(f"获取空间表失败: {e}")
-            return []
+        return [t for t in self.get_all_tables() if t['is_spatial']]
+    
+    def invalidate_tables_cache(self):
+        """清除表列表缓存"""
+        self._tables_cache.pop(self._postgis_key(), None)
     
     def get_all_tables(self):
-        """获取所有数据表"""
-        if not self.connection:
+        """获取所有数据表（短时缓存）"""
+        if not self.pool:
             return []
+        
+        key = self._postgis_key()
+        cached = self._tables_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.TABLES_CACHE_TTL:
+            return cached[1]
             
         try:
-            cursor = self.connection.cursor(cursor_factory=RealDictCursor)
-            cursor.execute("""
-                SELECT 
-                    t.table_schema,
-                    t.table_name,
-                    t.table_type,
-                    CASE WHEN g.f_table_name IS NOT NULL THEN true ELSE false END as is_spatial,
-                    g.type as geometry_type,
-                    g.srid,
-                    pg_size_pretty(pg_total_relation_size(quote_ident(t.table_schema)||'.'||quote_ident(t.table_name))) as table_size,
-                    (SELECT COUNT(*) FROM information_schema.columns 
-                     WHERE table_schema = t.table_schema AND table_name = t.table_name) as column_count
-                FROM information_schema.tables t
-                LEFT JOIN geometry_columns g ON t.table_name = g.f_table_name 
-                    AND t.table_schema = g.f_table_schema
-                WHERE t.table_type = 'BASE TABLE'
-                    AND t.table_schema NOT IN ('information_schema', 'pg_catalog')
-                ORDER BY t.table_schema, t.table_name
-            """)
-            
-            tables = cursor.fetchall()
-            cursor.close()
+            with self._conn(readonly=True) as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    cursor.execute("""
+                        SELECT 
+                            t.table_schema,
+                            t.table_name,
+                            t.table_type,
+                            CASE WHEN g.f_table_name IS NOT NULL THEN true ELSE false END as is_spatial,
+                            g.f_geometry_column,
+                            g.type as geometry_type,
+                            g.srid,
+                            pg_size_pretty(pg_total_relation_size(quote_ident(t.table_schema)||'.'||quote_ident(t.table_name))) as table_size,
+                            (SELECT COUNT(*) FROM information_schema.columns 
+                             WHERE table_schema = t.table_schema AND table_name = t.table_name) as column_count
+                        FROM information_schema.tables t
+                        LEFT JOIN geometry_columns g ON t.table_name = g.f_table_name 
+                            AND t.table_schema = g.f_table_schema
+                        WHERE t.table_type = 'BASE TABLE'
+                            AND t.table_schema NOT IN ('information_schema', 'pg_catalog')
+                        ORDER BY t.table_schema, t.table_name
+                    """)
+                    tables = cursor.fetchall()
+            
+            self._tables_cache[key] = (time.monotonic(), tables)
             return tables
             
         except Exception as e:
             self.logger.error(f"获取表列表失败: {e}")
             return []
 
+@lru_cache(maxsize=32)
+def _read_file_bytes(path, mtime_ns, size):
+    """读取文件原始字节（按路径、修改时间和大小缓存）"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def read_sld_bytes(path):
+    """读取SLD文件字节，文件未变化时直接返回缓存"""
+    stat = os.stat(path)
+    return _read_file_bytes(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
 class ImprovedGeoServerPublisher:
     """改进的GeoServer发布器"""
     
+    # REST查询缓存有效期（秒）：图层/数据存储变化较频繁，工作空间/样式较稳定
+    CACHE_TTL_SHORT = 5.0
+    CACHE_TTL_LONG = 30.0
+    
     def __init__(self, base_url, username, password):
         self.base_url = base_url.rstrip('/')
+        
+        # REST GET缓存 {url: (时间戳, JSON)}
+        self._cache = {}
+        self._cache_lock = threading.Lock()
         self.auth = (username, password)
         self.session = requests.Session()
         self.session.auth = self.auth
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        })
+        
+        # 连接池与重试：批量发布时复用keep-alive连接
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST", "PUT"])
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # 查询请求的默认超时（秒）
+        self._timeout = 10
         self.logger = log_manager.get_logger('GeoServerPublisher')
         
+    def _get(self, url, **kwargs):
+        """GET请求，使用默认超时"""
+        kwargs.setdefault('timeout', self._timeout)
+        return self.session.get(url, **kwargs)
+    
     def test_connection(self):
         """测试连接"""
         try:
             self.logger.info(f"测试GeoServer连接: {self.base_url}")
-            response = self.session.get(f"{self.base_url}/rest/about/version", timeout=10)
+            response = self._get(f"{self.base_url}/rest/about/version")
             
             if response.status_code == 200:
                 self.logger.info("GeoServer连接成功")
@@ -764,11 +1328,11 @@ class ImprovedGeoServerPublisher:
             response = self.session.post(
                 f"{self.base_url}/rest/workspaces",
                 json=workspace_data,
-                headers={'Content-Type': 'application/json'},
                 timeout=30
             )
             
             if response.status_code in [200, 201]:
+                self.invalidate("/rest/workspaces")
                 log_manager.log_operation("创建工作空间", workspace_name, True)
                 return True, "创建成功"
             elif response.status_code == 409:
@@ -811,11 +1375,11 @@ class ImprovedGeoServerPublisher:
             response = self.session.post(
                 f"{self.base_url}/rest/workspaces/{workspace}/datastores",
                 json=datastore_data,
-                headers={'Content-Type': 'application/json'},
                 timeout=30
             )
             
             if response.status_code in [200, 201]:
+                self.invalidate(f"/rest/workspaces/{workspace}/datastores")
                 log_manager.log_operation("创建数据存储", f"{workspace}/{datastore_name}", True)
                 return True, "创建成功"
             elif response.status_code == 409:
@@ -830,8 +1394,8 @@ class ImprovedGeoServerPublisher:
             return False, str(e)
     
     def publish_layer_from_table(self, workspace, datastore, table_name, layer_name=None, 
-                                title=None, srs="EPSG:4326"):
-        """从数据库表发布图层"""
+                                title=None, srs="EPSG:4326", native_bbox=None):
+        """从数据库表发布图层（给定native_bbox时GeoServer不再查询表计算范围）"""
         if layer_name is None:
             layer_name = table_name
         if title is None:
@@ -853,6 +1417,11 @@ class ImprovedGeoServerPublisher:
                 }
             }
         }
+        if native_bbox:
+            feature_type = featuretype_data["featureType"]
+            feature_type["nativeBoundingBox"] = {**native_bbox, "crs": srs}
+            if srs == "EPSG:4326":
+                feature_type["latLonBoundingBox"] = {**native_bbox, "crs": srs}
         
         try:
             self.logger.info(f"发布图层: {workspace}/{datastore}/{layer_name}")
@@ -860,11 +1429,12 @@ class ImprovedGeoServerPublisher:
             response = self.session.post(
                 f"{self.base_url}/rest/workspaces/{workspace}/datastores/{datastore}/featuretypes",
                 json=featuretype_data,
-                headers={'Content-Type': 'application/json'},
                 timeout=30
             )
             
             if response.status_code in [200, 201]:
+                self.invalidate(f"/rest/workspaces/{workspace}/layers")
+                self.invalidate(f"/rest/workspaces/{workspace}/datastores")
                 log_manager.log_operation("发布图层", f"{workspace}/{layer_name}", True)
                 return True, "发布成功"
             else:
@@ -876,7 +1446,7 @@ class ImprovedGeoServerPublisher:
             return False, str(e)
     
     def upload_style(self, style_name, sld_content, workspace=None):
-        """上传样式"""
+        """上传样式（sld_content为bytes时原样发送，str按UTF-8编码）"""
         try:
             self.logger.info(f"上传样式: {style_name}")
             
@@ -896,13 +1466,14 @@ class ImprovedGeoServerPublisher:
             response = self.session.post(
                 url,
                 json=style_data,
-                headers={'Content-Type': 'application/json'},
                 timeout=30
             )
             
             if response.status_code not in [200, 201]:
                 if response.status_code != 409:  # 不是已存在错误
                     return False, f"样式创建失败: {response.status_code}"
+            else:
+                self.invalidate(url[len(self.base_url):])
             
             # 上传SLD内容
             if workspace:
@@ -910,6 +1481,9 @@ class ImprovedGeoServerPublisher:
             else:
                 sld_url = f"{self.base_url}/rest/styles/{style_name}"
             
+            if isinstance(sld_content, str):
+                sld_content = sld_content.encode('utf-8')
+            
             sld_response = self.session.put(
                 sld_url,
                 data=sld_content,
@@ -918,6 +1492,7 @@ class ImprovedGeoServerPublisher:
             )
             
             if sld_response.status_code in [200, 201]:
+                self.invalidate(url[len(self.base_url):])
                 log_manager.log_operation("上传样式", style_name, True)
                 return True, "上传成功"
             else:
@@ -928,114 +1503,108 @@ class ImprovedGeoServerPublisher:
             log_manager.log_exception("上传样式", e)
             return False, str(e)
     
-    def get_workspaces(self):
-        """获取工作空间"""
+    def invalidate(self, prefix=""):
+        """清除REST缓存（prefix为 /rest/... 形式的路径前缀）"""
+        full_prefix = f"{self.base_url}{prefix}"
+        with self._cache_lock:
+            for url in [u for u in self._cache if u.startswith(full_prefix)]:
+                del self._cache[url]
+    
+    def refresh(self):
+        """清空全部REST缓存"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _cached_get(self, url, ttl):
+        """带短时缓存的GET，返回解析后的JSON（非200返回None），请求失败时回退到旧缓存"""
+        with self._cache_lock:
+            cached = self._cache.get(url)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
         try:
-            url = f"{self.base_url}/rest/workspaces"
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                workspaces = data.get('workspaces', {})
-                
-                if workspaces and 'workspace' in workspaces:
-                    workspace_list = workspaces['workspace']
-                    if isinstance(workspace_list, dict):
-                        return [workspace_list]
-                    return workspace_list if isinstance(workspace_list, list) else []
-                        
-            return []
-            
+            response = self._get(url)
         except Exception as e:
-            self.logger.error(f"获取工作空间失败: {e}")
-            return []
+            if cached:
+                self.logger.warning("REST请求失败，使用缓存数据: %s (%s)", url, e)
+                return cached[1]
+            raise
+        
+        if response.status_code != 200:
+            return None
+        
+        data = _json_loads(response.content)
+        with self._cache_lock:
+            self._cache[url] = (time.monotonic(), data)
+        return data
     
-    def get_datastores(self, workspace):
-        """获取数据存储"""
+    def _list_rest(self, path, container_key, item_key, ttl, what):
+        """获取REST集合并规范为列表（单个元素时包装为列表），失败时返回[]"""
         try:
-            url = f"{self.base_url}/rest/workspaces/{workspace}/datastores"
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                datastores = data.get('dataStores', {})
-                
-                if datastores and 'dataStore' in datastores:
-                    datastore_list = datastores['dataStore']
-                    if isinstance(datastore_list, dict):
-                        return [datastore_list]
-                    return datastore_list if isinstance(datastore_list, list) else []
-                        
-            return []
+            data = self._cached_get(f"{self.base_url}{path}", ttl)
+            container = (data or {}).get(container_key) or {}
+            items = container.get(item_key)
+            if isinstance(items, dict):
+                return [items]
+            return items if isinstance(items, list) else []
             
         except Exception as e:
-            self.logger.error(f"获取数据存储失败: {e}")
+            self.logger.error(f"获取{what}失败: {e}")
             return []
     
+    def get_workspaces(self):
+        """获取工作空间"""
+        return self._list_rest("/rest/workspaces", 'workspaces', 'workspace',
+                               self.CACHE_TTL_LONG, "工作空间")
+    
+    def get_datastores(self, workspace):
+        """获取数据存储"""
+        return self._list_rest(f"/rest/workspaces/{workspace}/datastores", 'dataStores', 'dataStore',
+                               self.CACHE_TTL_SHORT, "数据存储")
+    
     def get_layers(self, workspace):
         """获取图层"""
-        try:
-            url = f"{self.base_url}/rest/workspaces/{workspace}/layers"
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                layers = data.get('layers', {})
-                
-                if layers and 'layer' in layers:
-                    layer_list = layers['layer']
-                    if isinstance(layer_list, dict):
-                        return [layer_list]
-                    return layer_list if isinstance(layer_list, list) else []
-                        
-            return []
-            
-        except Exception as e:
-            self.logger.error(f"获取图层失败: {e}")
-            return []
+        return self._list_rest(f"/rest/workspaces/{workspace}/layers", 'layers', 'layer',
+                               self.CACHE_TTL_SHORT, "图层")
     
     def get_styles(self, workspace=None):
         """获取样式"""
-        try:
-            if workspace:
-                url = f"{self.base_url}/rest/workspaces/{workspace}/styles"
-            else:
-                url = f"{self.base_url}/rest/styles"
-                
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                styles = data.get('styles', {})
-                
-                if styles and 'style' in styles:
-                    style_list = styles['style']
-                    if isinstance(style_list, dict):
-                        return [style_list]
-                    return style_list if isinstance(style_list, list) else []
-                        
-            return []
-            
-        except Exception as e:
-            self.logger.error(f"获取样式失败: {e}")
-            return []
+        path = f"/rest/workspaces/{workspace}/styles" if workspace else "/rest/styles"
+        return self._list_rest(path, 'styles', 'style', self.CACHE_TTL_LONG, "样式")
 
 class ImprovedBatchProcessor:
     """改进的批处理器"""
     
-    def __init__(self, pg_params, gs_config):
-        self.pg_manager = ImprovedPostgreSQLManager(pg_params)
-        self.gs_publisher = ImprovedGeoServerPublisher(**gs_config)
+    def __init__(self, pg_params, gs_config=None, max_workers=4, publish_workers=6,
+                 gs_publisher=None, is_cancelled=None):
+        # 每个工作线程从连接池借用独立的数据库连接
+        self.max_workers = max(1, max_workers)
+        self.pg_manager = ImprovedPostgreSQLManager(pg_params, maxconn=self.max_workers + 1)
+        # 优先复用调用方已有的发布器（共享Session连接池和REST缓存）
+        self.gs_publisher = gs_publisher or ImprovedGeoServerPublisher(**gs_config)
+        # 发布线程池：REST请求以延迟为主，通过共享Session的连接池并发发送
+        self._publish_pool = ThreadPoolExecutor(max_workers=publish_workers)
         self.logger = log_manager.get_logger('BatchProcessor')
         self._cancelled = False
+        # 调用方的取消状态（如SafeWorker.is_cancelled），与cancel()任一生效即取消
+        self._external_cancelled = is_cancelled
         
     def cancel(self):
         """取消批处理"""
         self._cancelled = True
+    
+    def is_cancelled(self):
+        """是否已取消"""
+        return self._cancelled or bool(self._external_cancelled and self._external_cancelled())
+    
+    def close(self):
+        """释放发布线程池和数据库连接池"""
+        self._publish_pool.shutdown(wait=True)
+        self.pg_manager.close()
         
     def process_data_items(self, data_items, workspace, datastore_name, 
                           progress_callback=None, status_callback=None):
-        """批量处理数据项"""
+        """批量处理数据项（status_callback(文本, force=False)，最终状态以force=True发送）"""
         
         try:
             # 连接数据库
@@ -1066,52 +1635,108 @@ class ImprovedBatchProcessor:
             
             self.logger.info(f"开始批处理 {total_items} 个数据项")
             
-            for i, item in enumerate(data_items):
-                # 检查是否取消
-                if self._cancelled:
-                    status_callback("操作已取消")
-                    return False, "操作已取消"
+            done_count = 0
+            publish_futures = {}
+            
+            # 大文件按批次汇报导入进度：{id(正在导入的数据项): 已完成比例}
+            progress_lock = threading.Lock()
+            fractions = {}
+            
+            def report_progress():
+                if progress_callback:
+                    with progress_lock:
+                        value = (done_count + sum(fractions.values())) * 100 // total_items
+                    progress_callback(value)
+            
+            def batch_progress(item, done, total):
+                # 要素总数未知时只按数据项计进度
+                if not total:
+                    return
+                with progress_lock:
+                    fractions[id(item)] = min(done / total, 1.0)
+                report_progress()
+            
+            def finish(item, ok):
+                """记录单个数据项的最终结果（只在当前线程调用）"""
+                nonlocal done_count, success_count, error_count
+                with progress_lock:
+                    fractions.pop(id(item), None)
+                    done_count += 1
+                if ok:
+                    success_count += 1
+                    self.logger.info(f"处理成功: {item.new_name}")
+                else:
+                    error_count += 1
                 
-                try:
-                    if progress_callback:
-                        progress_callback(int((i / total_items) * 100))
+                report_progress()
+                
+                if status_callback:
+                    status_callback(f"已完成: {item.new_name} ({done_count}/{total_items})")
+            
+            def import_done(item, ok, info):
+                """导入完成后立即提交发布任务，导入与发布流水线执行"""
+                if ok:
+                    future = self._publish_pool.submit(
+                        self._publish_single_item, item, workspace, datastore_name, info
+                    )
+                    publish_futures[future] = item
+                else:
+                    self.logger.error(f"导入失败: {item.new_name}")
+                    finish(item, False)
+            
+            workers = min(self.max_workers, total_items)
+            if workers <= 1:
+                # 同步导入
+                for item in data_items:
+                    # 检查是否取消
+                    if self.is_cancelled():
+                        break
                     
                     if status_callback:
-                        status_callback(f"正在处理: {item['new_name']}")
+                        status_callback(f"正在导入: {item.new_name}")
                     
-                    # 导入到PostgreSQL
-                    import_success = self._import_single_item(item)
+                    import_done(item, *self._import_single_item(item, partial(batch_progress, item)))
+            else:
+                # 目标表相同的数据项按原顺序串行导入，避免并发DROP/CREATE同一张表
+                by_table = {}
+                for item in data_items:
+                    by_table.setdefault(item.new_name, []).append(item)
+                
+                def import_group(group):
+                    return [(item,) + self._import_single_item(item, partial(batch_progress, item))
+                            for item in group]
+                
+                # 并发导入：每个工作线程从连接池借用独立连接
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(import_group, group) for group in by_table.values()]
                     
-                    if import_success:
-                        # 发布到GeoServer
-                        publish_success = self._publish_single_item(
-                            item, workspace, datastore_name
-                        )
+                    for future in as_completed(futures):
+                        for item, ok, info in future.result():
+                            import_done(item, ok, info)
                         
-                        if publish_success:
-                            success_count += 1
-                            self.logger.info(f"处理成功: {item['new_name']}")
-                        else:
-                            error_count += 1
-                            self.logger.error(f"发布失败: {item['new_name']}")
-                    else:
-                        error_count += 1
-                        self.logger.error(f"导入失败: {item['new_name']}")
-                        
-                except Exception as e:
-                    error_count += 1
-                    log_manager.log_exception(f"处理数据项 {item['new_name']}", e)
-                    
-                    # 检查是否取消
-                    if self._cancelled:
-                        status_callback("操作已取消")
-                        return False, "操作已取消"
+                        # 取消时丢弃尚未开始的任务
+                        if self.is_cancelled():
+                            executor.shutdown(wait=True, cancel_futures=True)
+                            break
+            
+            # 等待发布完成
+            for future in as_completed(publish_futures):
+                item = publish_futures[future]
+                ok = future.result()
+                if not ok:
+                    self.logger.error(f"发布失败: {item.new_name}")
+                finish(item, ok)
+            
+            if self.is_cancelled():
+                if status_callback:
+                    status_callback("操作已取消", force=True)
+                return False, "操作已取消"
             
             if progress_callback:
                 progress_callback(100)
             
             if status_callback:
-                status_callback(f"处理完成: 成功 {success_count}, 失败 {error_count}")
+                status_callback(f"处理完成: 成功 {success_count}, 失败 {error_count}", force=True)
             
             log_manager.log_operation(
                 "批量处理数据", 
@@ -1124,144 +1749,427 @@ class ImprovedBatchProcessor:
         except Exception as e:
             log_manager.log_exception("批量处理数据", e)
             return False, str(e)
+        finally:
+            self.pg_manager.close()
     
-    def _import_single_item(self, item):
-        """导入单个数据项"""
+    def _import_single_item(self, item, progress_callback=None):
+        """导入单个数据项，返回 (成功, 导入信息)；progress_callback(已处理要素数, 要素总数)"""
         try:
             # 检查是否取消
-            if self._cancelled:
-                return False
+            if self.is_cancelled():
+                return False, None
                 
-            file_path = item['path']
-            table_name = item['new_name']
-            data_type = item['type']
+            file_path = item.path
+            table_name = item.new_name
+            data_type = item.type
             
             # 检测SRID
-            srid_text = item.get('srs', 'EPSG:4326')
+            srid_text = item.srs
             target_crs = srid_text if srid_text.startswith('EPSG:') else 'EPSG:4326'
             
             if data_type == "矢量数据":
-                success, message = self.pg_manager.import_vector_file(
-                    file_path, table_name, target_crs=target_crs
+                success, message, info = self.pg_manager.import_vector_file_with_info(
+                    file_path, table_name, target_crs=target_crs, use_copy=True,
+                    progress_callback=progress_callback, is_cancelled=self.is_cancelled
                 )
-                return success
+                return success, info
                 
             elif data_type == "栅格数据":
                 success, message = self.pg_manager.import_raster_file(
                     file_path, table_name, target_crs=target_crs
                 )
-                return success
+                return success, None
                 
             elif data_type == "空间表":
                 # 已经在数据库中，跳过导入
-                return True
+                return True, None
             else:
                 self.logger.warning(f"未知数据类型: {data_type}")
-                return False
+                return False, None
                 
         except Exception as e:
-            log_manager.log_exception(f"导入数据项 {item['new_name']}", e)
-            return False
+            log_manager.log_exception(f"导入数据项 {item.new_name}", e)
+            return False, None
     
-    def _publish_single_item(self, item, workspace, datastore_name):
-        """发布单个数据项"""
+    def _publish_single_item(self, item, workspace, datastore_name, info=None):
+        """发布单个数据项（info为导入阶段返回的信息，有则直接使用其SRID和范围）"""
         try:
             # 检查是否取消
-            if self._cancelled:
+            if self.is_cancelled():
                 return False
                 
-            table_name = item['new_name']
-            layer_name = item['new_name']
-            srid_text = item.get('srs', 'EPSG:4326')
+            table_name = item.new_name
+            layer_name = item.new_name
+            srid_text = item.srs
+            native_bbox = None
+            if info and info['srid']:
+                srid_text = f"EPSG:{info['srid']}"
+                native_bbox = info['extent']
             
             # 发布图层
             success, message = self.gs_publisher.publish_layer_from_table(
-                workspace, datastore_name, table_name, layer_name, srs=srid_text
+                workspace, datastore_name, table_name, layer_name, srs=srid_text,
+                native_bbox=native_bbox
             )
             
             return success
             
         except Exception as e:
-            log_manager.log_exception(f"发布数据项 {item['new_name']}", e)
+            log_manager.log_exception(f"发布数据项 {item.new_name}", e)
             return False
 
 # ================== GUI界面部分 ==================
 
+# 主界面样式表
+_MAIN_STYLESHEET = """
+    QMainWindow {
+        background-color: #f0f0f0;
+    }
+    QTabWidget::pane {
+        border: 1px solid #c0c0c0;
+        background-color: white;
+    }
+    QTabBar::tab {
+        padding: 8px 16px;
+        margin: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: #4CAF50;
+        color: white;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 5px;
+        margin: 5px 0px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QPushButton {
+        padding: 6px 12px;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        background-color: #f8f9fa;
+    }
+    QPushButton:hover {
+        background-color: #e9ecef;
+    }
+    QPushButton:pressed {
+        background-color: #dee2e6;
+    }
+    QPushButton:disabled {
+        background-color: #e9ecef;
+        color: #6c757d;
+    }
+    QLineEdit, QComboBox {
+        padding: 4px;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+    }
+    QTreeView, QTableView {
+        border: 1px solid #ccc;
+        alternate-background-color: #f9f9f9;
+    }
+    QProgressBar {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #4CAF50;
+        border-radius: 3px;
+    }
+"""
+
+# 图标（使用文字代替图标）
+_ICONS = {
+    'server': '🌍',
+    'database': '🗄️',
+    'import': '📥',
+    'style': '🎨',
+    'layers': '📋',
+    'connect': '🔌',
+    'refresh': '🔄',
+    'folder': '📁',
+    'file': '📄',
+    'map': '🗺️',
+    'table': '📋',
+    'spatial': '🌐',
+    'success': '✅',
+    'error': '❌',
+    'warning': '⚠️',
+    'loading': '⏳',
+    'log': '📝',
+    'cancel': '❌'
+}
+
 def get_icon(name):
     """获取图标，使用文字代替图标"""
-    icons = {
-        'server': '🌍',
-        'database': '🗄️',
-        'import': '📥',
-        'style': '🎨',
-        'layers': '📋',
-        'connect': '🔌',
-        'refresh': '🔄',
-        'folder': '📁',
-        'file': '📄',
-        'map': '🗺️',
-        'table': '📋',
-        'spatial': '🌐',
-        'success': '✅',
-        'error': '❌',
-        'warning': '⚠️',
-        'loading': '⏳',
-        'log': '📝',
-        'cancel': '❌'
-    }
-    return icons.get(name, '📄')
+    return _ICONS.get(name, '📄')
+
+# 已发布图层表格中的固定列文本
+_LAYER_STYLE_TEXT = "默认样式"
+_LAYER_SOURCE_TEXT = "PostGIS"
+
+# 常用图标前缀，导入时取一次，界面文字直接拼接
+ICON_SERVER = _ICONS['server']
+ICON_DATABASE = _ICONS['database']
+ICON_IMPORT = _ICONS['import']
+ICON_STYLE = _ICONS['style']
+ICON_LAYERS = _ICONS['layers']
+ICON_CONNECT = _ICONS['connect']
+ICON_REFRESH = _ICONS['refresh']
+ICON_FOLDER = _ICONS['folder']
+ICON_FILE = _ICONS['file']
+ICON_MAP = _ICONS['map']
+ICON_TABLE = _ICONS['table']
+ICON_SPATIAL = _ICONS['spatial']
+ICON_SUCCESS = _ICONS['success']
+ICON_ERROR = _ICONS['error']
+ICON_WARNING = _ICONS['warning']
+ICON_LOADING = _ICONS['loading']
+ICON_LOG = _ICONS['log']
+ICON_CANCEL = _ICONS['cancel']
+
+def fix_table_sizing(table, column_widths, row_height=24):
+    """固定表格列宽和行高，避免插入数据时逐行逐列测量内容"""
+    header = table.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    for column, width in enumerate(column_widths):
+        header.resizeSection(column, width)
+    header.setStretchLastSection(True)
+    
+    vertical = table.verticalHeader()
+    vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    vertical.setDefaultSectionSize(row_height)
+
+@contextmanager
+def frozen(widget):
+    """批量修改期间冻结控件：暂停重绘、屏蔽信号和排序，结束后统一重绘一次"""
+    sortable = hasattr(widget, 'setSortingEnabled')
+    sorting = sortable and widget.isSortingEnabled()
+    if sorting:
+        widget.setSortingEnabled(False)
+    widget.setUpdatesEnabled(False)
+    blocker = QSignalBlocker(widget)
+    try:
+        yield widget
+    finally:
+        blocker.unblock()
+        widget.setUpdatesEnabled(True)
+        if sorting:
+            widget.setSortingEnabled(True)
+        if hasattr(widget, 'viewport'):
+            widget.viewport().update()
+
+def set_combo_items(combo, items):
+    """更新下拉框选项：内容未变化时不动，变化时保留当前文本"""
+    if [combo.itemText(i) for i in range(combo.count())] == items:
+        return
+    
+    with frozen(combo):
+        current = combo.currentText()
+        combo.clear()
+        combo.addItems(items)
+        combo.setCurrentText(current)
+
+@dataclass(slots=True)
+class ScanItem:
+    """扫描得到的单个数据项"""
+    original_name: str
+    path: str
+    type: str
+    size: str
+    new_name: str
+    srs: str = 'EPSG:4326'
+    style: str = 'default'
+    geometry_type: Optional[str] = None
+    feature_count: Optional[int] = None
+    extent: Optional[dict] = None
 
 class ImprovedDataScanner:
     """改进的数据扫描器"""
     
-    def __init__(self):
+    def __init__(self, cache_path=SCAN_CACHE_PATH):
         self.logger = log_manager.get_logger('DataScanner')
         if HAS_SPATIAL_LIBS:
             self.processor = ImprovedSpatialDataProcessor()
         else:
             self.processor = None
+        self._cache_db = self._open_cache(cache_path)
+    
+    def _open_cache(self, cache_path):
+        """打开扫描结果缓存（失败时不使用缓存）"""
+        try:
+            cache_path = Path(cache_path)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(cache_path), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    mtime REAL,
+                    size INTEGER,
+                    version TEXT,
+                    info_json TEXT
+                )
+            """)
+            db.commit()
+            return db
+        except Exception as e:
+            self.logger.warning(f"扫描缓存不可用: {e}")
+            return None
+    
+    def _cache_get(self, path, mtime, size):
+        """查询缓存，文件未变化且版本一致时返回数据项（缓存行损坏时视为未命中）"""
+        if self._cache_db is None:
+            return None
+        try:
+            row = self._cache_db.execute(
+                "SELECT info_json FROM files WHERE path = ? AND mtime = ? AND size = ? AND version = ?",
+                (path, mtime, size, _SCAN_CACHE_VERSION)
+            ).fetchone()
+            return ScanItem(**_json_loads(row[0])) if row else None
+        except sqlite3.Error as e:
+            self.logger.warning(f"读取扫描缓存失败 {path}: {e}")
+            return None
+        except (ValueError, TypeError) as e:
+            # JSON损坏或字段不匹配：删除该行，重新读取文件
+            self.logger.debug("扫描缓存行无效 %s: %s", path, e)
+            try:
+                self._cache_db.execute("DELETE FROM files WHERE path = ?", (path,))
+                self._cache_db.commit()
+            except sqlite3.Error:
+                pass
+            return None
+    
+    def _cache_put(self, rows):
+        """批量写入缓存 [(path, mtime, size, data_item)]"""
+        if self._cache_db is None or not rows:
+            return
+        try:
+            self._cache_db.executemany(
+                "INSERT OR REPLACE INTO files (path, mtime, size, version, info_json) VALUES (?, ?, ?, ?, ?)",
+                [(path, mtime, size, _SCAN_CACHE_VERSION, json.dumps(asdict(item), ensure_ascii=False))
+                 for path, mtime, size, item in rows]
+            )
+            self._cache_db.commit()
+        except Exception as e:
+            self.logger.warning(f"写入扫描缓存失败: {e}")
+    
+    def close(self):
+        """关闭缓存数据库"""
+        if self._cache_db is not None:
+            self._cache_db.close()
+            self._cache_db = None
+    
+    def _iter_spatial_files(self, folder_path):
+        """使用os.scandir递归遍历空间数据文件，直接复用目录项中的类型信息"""
+        try:
+            with os.scandir(folder_path) as entries:
+                subdirs = []
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        if os.path.splitext(entry.name)[1].lower() in _SPATIAL_EXT:
+                            yield entry
+        except OSError as e:
+            self.logger.warning(f"无法读取目录 {folder_path}: {e}")
+            return
+        
+        for subdir in subdirs:
+            yield from self._iter_spatial_files(subdir)
+    
+    def _make_item(self, entry, size):
+        """读取单个文件信息并生成数据项"""
+        file_path = entry.path
+        try:
+            # 只读文件头获取信息
+            file_info = self.processor.get_file_info_fast(file_path, size)
+            
+            if file_info:
+                return ScanItem(
+                    original_name=entry.name,
+                    path=file_path,
+                    type=file_info['type'],
+                    size=file_info['size_formatted'],
+                    srs=file_info.get('crs', 'EPSG:4326'),
+                    new_name=self.normalize_name(file_info['name']),
+                    geometry_type=file_info.get('geometry_type'),
+                    feature_count=file_info.get('feature_count'),
+                    extent=file_info.get('extent')
+                )
+                
+        except Exception as e:
+            self.logger.warning(f"处理文件失败 {file_path}: {e}")
+        return None
+    
+    def iter_folder(self, folder_path, max_workers=None):
+        """逐个产出文件夹中的空间数据项（生成器，边遍历边产出，保持遍历顺序）"""
+        if not self.processor:
+            raise ImportError("缺少空间数据处理库")
+        
+        workers = max_workers or os.cpu_count() or 4
+        # 按遍历顺序排队：(路径, 修改时间, 大小, 缓存的数据项或读取文件头的Future)
+        pending = deque()
+        window = workers * 4
+        new_rows = []
+        
+        def pop_ready():
+            path, mtime, size, data_item = pending.popleft()
+            if isinstance(data_item, Future):
+                data_item = data_item.result()
+                if data_item:
+                    new_rows.append((path, mtime, size, data_item))
+            return data_item
+        
+        try:
+            # 未命中缓存的文件并发读取文件头（GDAL在I/O期间释放GIL）
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for entry in self._iter_spatial_files(folder_path):
+                    try:
+                        stat = entry.stat()
+                    except OSError as e:
+                        self.logger.warning(f"处理文件失败 {entry.path}: {e}")
+                        continue
+                    
+                    # 命中缓存（路径、修改时间、大小均未变化）的文件直接使用
+                    data_item = self._cache_get(entry.path, stat.st_mtime, stat.st_size)
+                    if data_item is None:
+                        data_item = executor.submit(self._make_item, entry, stat.st_size)
+                    pending.append((entry.path, stat.st_mtime, stat.st_size, data_item))
+                    
+                    # 队首已就绪就立即产出；排队过长时等待队首，限制未产出的数量
+                    while pending and (len(pending) > window
+                                       or not isinstance(pending[0][3], Future)
+                                       or pending[0][3].done()):
+                        data_item = pop_ready()
+                        if data_item:
+                            yield data_item
+                
+                while pending:
+                    data_item = pop_ready()
+                    if data_item:
+                        yield data_item
+        finally:
+            self._cache_put(new_rows)
     
     def scan_folder(self, folder_path):
         """扫描文件夹中的空间数据"""
         if not self.processor:
             raise ImportError("缺少空间数据处理库")
-            
-        vector_extensions = {'.shp', '.geojson', '.kml', '.gpkg', '.gml'}
-        raster_extensions = {'.tif', '.tiff', '.img', '.jp2', '.png', '.jpg'}
         
         found_data = []
         
         try:
             self.logger.info(f"开始扫描文件夹: {folder_path}")
-            
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    file_ext = Path(file).suffix.lower()
-                    
-                    if file_ext in vector_extensions or file_ext in raster_extensions:
-                        try:
-                            # 获取详细文件信息
-                            file_info = self.processor.get_file_info(file_path)
-                            
-                            if file_info:
-                                data_item = {
-                                    'original_name': file,
-                                    'path': file_path,
-                                    'type': file_info['type'],
-                                    'size': file_info['size_formatted'],
-                                    'srs': file_info.get('crs', 'EPSG:4326'),
-                                    'new_name': self.normalize_name(Path(file).stem),
-                                    'style': 'default',
-                                    'geometry_type': file_info.get('geometry_type'),
-                                    'feature_count': file_info.get('feature_count'),
-                                    'extent': file_info.get('extent')
-                                }
-                                found_data.append(data_item)
-                                
-                        except Exception as e:
-                            self.logger.warning(f"处理文件失败 {file_path}: {e}")
-                            
+            found_data.extend(self.iter_folder(folder_path))
             self.logger.info(f"扫描完成，找到 {len(found_data)} 个空间数据文件")
             
         except Exception as e:
@@ -1272,10 +2180,19 @@ class ImprovedDataScanner:
     @staticmethod
     def normalize_name(name):
         """规范化名称"""
+        # 已经是规范名称时直接返回
+        if (_TABLE_NAME_RE.fullmatch(name) and name.islower()
+                and '__' not in name and not name.endswith('_')):
+            return name
+        
         # 转换为小写，替换空格和特殊字符为下划线
-        normalized = re.sub(r'[^a-z0-9_]', '_', name.lower())
+        normalized = name.lower()
+        if normalized.isascii():
+            normalized = normalized.translate(_NORMALIZE_TABLE)
+        else:
+            normalized = _NAME_INVALID_RE.sub('_', normalized)
         # 移除多余的下划线
-        normalized = re.sub(r'_+', '_', normalized)
+        normalized = _MULTI_US_RE.sub('_', normalized)
         # 移除开头和结尾的下划线
         normalized = normalized.strip('_')
         
@@ -1289,7 +2206,7 @@ class LogViewDialog(QDialog):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setWindowTitle(f"{get_icon('log')} 日志查看器")
+        self.setWindowTitle(f"{ICON_LOG} 日志查看器")
         self.setModal(False)
         self.resize(800, 600)
         
@@ -1298,7 +2215,7 @@ class LogViewDialog(QDialog):
         # 工具栏
         toolbar_layout = QHBoxLayout()
         
-        self.refresh_btn = QPushButton(f"{get_icon('refresh')} 刷新")
+        self.refresh_btn = QPushButton(f"{ICON_REFRESH} 刷新")
         self.refresh_btn.clicked.connect(self.refresh_logs)
         
         self.clear_btn = QPushButton("🗑️ 清空")
@@ -1327,19 +2244,44 @@ class LogViewDialog(QDialog):
         
         self.setLayout(layout)
         
+        # 上次读取时日志文件的 (大小, 修改时间)
+        self._log_state = None
+        
         # 加载日志
         self.refresh_logs()
     
+    @staticmethod
+    def _read_tail(log_file, max_lines=1000, chunk_size=256 * 1024):
+        """从文件末尾读取最后max_lines行，不足时扩大读取窗口"""
+        with open(log_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            window = chunk_size
+            while True:
+                start = max(0, size - window)
+                f.seek(start)
+                lines = f.read(size - start).decode('utf-8', errors='replace').splitlines(keepends=True)
+                if start > 0:
+                    # 丢弃窗口起始处不完整的一行
+                    lines = lines[1:]
+                if len(lines) >= max_lines or start == 0:
+                    return ''.join(lines[-max_lines:])
+                window *= 4
+    
     def refresh_logs(self):
         """刷新日志"""
         try:
             log_file = log_manager.log_dir / 'application.log'
             if log_file.exists():
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    # 读取最后1000行
-                    lines = f.readlines()
-                    recent_lines = lines[-1000:] if len(lines) > 1000 else lines
-                    self.log_text.setPlainText(''.join(recent_lines))
+                stat = log_file.stat()
+                state = (stat.st_size, stat.st_mtime_ns)
+                if state == self._log_state:
+                    # 日志没有新内容
+                    return
+                
+                # 读取最后1000行
+                self.log_text.setPlainText(self._read_tail(log_file))
+                self._log_state = state
                     
                 # 滚动到底部
                 scrollbar = self.log_text.verticalScrollBar()
@@ -1350,6 +2292,7 @@ class LogViewDialog(QDialog):
     def clear_logs(self):
         """清空日志显示"""
         self.log_text.clear()
+        self._log_state = None
     
     def export_logs(self):
         """导出日志"""
@@ -1372,13 +2315,15 @@ class DatabaseConnection:
     """数据库连接管理类"""
     
     def __init__(self):
-        self.connection = None
+        self.pg_manager = None
         self.params = {}
+        self.connected = False
         self.logger = log_manager.get_logger('DatabaseConnection')
         
     def test_connection(self, host, port, database, username, password):
         """测试数据库连接"""
         try:
+            self.close()
             self.params = {
                 'host': host,
                 'port': int(port),
@@ -1390,34 +2335,53 @@ class DatabaseConnection:
             self.logger.info(f"测试数据库连接: {host}:{port}/{database}")
             
             conn = psycopg2.connect(**self.params)
-            
-            # 检查PostGIS扩展
-            cursor = conn.cursor()
-            cursor.execute("SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname='postgis')")
-            has_postgis = cursor.fetchone()[0]
-            cursor.close()
+            try:
+                # 检查PostGIS扩展（自动提交，不留下未结束的事务）
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname='postgis')")
+                    has_postgis = cursor.fetchone()[0]
+            finally:
+                # 任何情况下都关闭测试连接，避免占用服务器连接数
+                conn.close()
             
             if has_postgis:
-                self.connection = conn
+                # 后续查询统一走连接池
+                self.pg_manager = ImprovedPostgreSQLManager(self.params)
+                success, message = self.pg_manager.connect()
+                if not success:
+                    return False, f"连接失败: {message}"
+                # 重新连接后不沿用之前的表列表
+                self.pg_manager.invalidate_tables_cache()
+                self.connected = True
                 log_manager.log_operation("数据库连接测试", f"{host}:{port}/{database}", True)
                 return True, "连接成功，PostGIS扩展已安装"
             else:
-                conn.close()
                 return False, "连接成功，但未安装PostGIS扩展"
                 
         except Exception as e:
             log_manager.log_exception("数据库连接测试", e)
             return False, f"连接失败: {str(e)}"
     
+    def close(self):
+        """关闭连接"""
+        if self.pg_manager:
+            self.pg_manager.close()
+        self.pg_manager = None
+        self.connected = False
+    
+    def refresh(self):
+        """清除表列表缓存，下次查询直接访问数据库"""
+        if self.pg_manager:
+            self.pg_manager.invalidate_tables_cache()
+    
     def get_spatial_tables(self):
         """获取空间数据表"""
-        if not self.connection:
+        if not self.connected:
             return []
             
         try:
-            pg_manager = ImprovedPostgreSQLManager(self.params)
-            pg_manager.connection = self.connection
-            return pg_manager.get_spatial_tables()
+            return self.pg_manager.get_spatial_tables()
             
         except Exception as e:
             self.logger.error(f"获取空间表失败: {e}")
@@ -1425,17 +2389,22 @@ class DatabaseConnection:
     
     def get_all_tables(self):
         """获取所有数据表"""
-        if not self.connection:
+        if not self.connected:
             return []
             
         try:
-            pg_manager = ImprovedPostgreSQLManager(self.params)
-            pg_manager.connection = self.connection
-            return pg_manager.get_all_tables()
+            return self.pg_manager.get_all_tables()
             
         except Exception as e:
             self.logger.error(f"获取表列表失败: {e}")
             return []
+    
+    def rename_table(self, old_name, new_name, schema='public'):
+        """重命名表（复用连接池）"""
+        if not self.connected:
+            return False, "数据库未连接"
+        
+        return self.pg_manager.rename_table(old_name, new_name, schema)
 
 class GeoServerConnection:
     """GeoServer连接管理类"""
@@ -1446,20 +2415,41 @@ class GeoServerConnection:
         self.password = ""
         self.auth = None
         self.connected = False
+        self._publisher = None
         self.logger = log_manager.get_logger('GeoServerConnection')
+    
+    def refresh(self):
+        """清空REST缓存，下次查询直接请求GeoServer"""
+        if self._publisher is not None:
+            self._publisher.refresh()
+    
+    def invalidate_cache(self, prefix="/rest/workspaces"):
+        """清除指定路径前缀下的REST缓存（默认工作空间及其数据存储、图层）"""
+        if self._publisher is not None:
+            self._publisher.invalidate(prefix)
+    
+    @property
+    def publisher(self):
+        """当前连接的发布器（首次使用时创建，连接参数变化后重建）"""
+        if self._publisher is None or self._publisher.base_url != self.base_url:
+            self._publisher = ImprovedGeoServerPublisher(self.base_url, self.username, self.password)
+        return self._publisher
         
     def test_connection(self, url, username, password):
         """测试GeoServer连接"""
         try:
+            self._publisher = None
             self.base_url = url.rstrip('/')
             self.username = username
             self.password = password
             self.auth = (username, password)
+            self.connected = False
             
             self.logger.info(f"测试GeoServer连接: {url}")
             
+            # 每个连接只创建一个发布器，复用其Session连接池
             test_url = f"{self.base_url}/rest/about/version"
-            response = requests.get(test_url, auth=self.auth, timeout=10)
+            response = self.publisher._get(test_url)
             
             if response.status_code == 200:
                 self.connected = True
@@ -1478,8 +2468,7 @@ class GeoServerConnection:
             return []
             
         try:
-            publisher = ImprovedGeoServerPublisher(self.base_url, self.username, self.password)
-            return publisher.get_workspaces()
+            return self.publisher.get_workspaces()
             
         except Exception as e:
             self.logger.error(f"获取工作空间失败: {e}")
@@ -1487,9 +2476,11 @@ class GeoServerConnection:
     
     def get_datastores(self, workspace):
         """获取数据存储"""
+        if not self.connected:
+            return []
+            
         try:
-            publisher = ImprovedGeoServerPublisher(self.base_url, self.username, self.password)
-            return publisher.get_datastores(workspace)
+            return self.publisher.get_datastores(workspace)
             
         except Exception as e:
             self.logger.error(f"获取数据存储失败: {e}")
@@ -1497,9 +2488,11 @@ class GeoServerConnection:
     
     def get_layers(self, workspace):
         """获取图层"""
+        if not self.connected:
+            return []
+            
         try:
-            publisher = ImprovedGeoServerPublisher(self.base_url, self.username, self.password)
-            return publisher.get_layers(workspace)
+            return self.publisher.get_layers(workspace)
             
         except Exception as e:
             self.logger.error(f"获取图层失败: {e}")
@@ -1507,13 +2500,267 @@ class GeoServerConnection:
     
     def get_styles(self, workspace=None):
         """获取样式"""
+        if not self.connected:
+            return []
+            
         try:
-            publisher = ImprovedGeoServerPublisher(self.base_url, self.username, self.password)
-            return publisher.get_styles(workspace)
+            return self.publisher.get_styles(workspace)
             
         except Exception as e:
             self.logger.error(f"获取样式失败: {e}")
             return []
+    
+    def fetch_many(self, calls):
+        """并发执行{键: (函数, 参数...)}中的请求，全部完成后返回{键: 结果}"""
+        # 请求共用publisher的Session连接池
+        futures = {_REST_EXECUTOR.submit(*call): key for key, call in calls.items()}
+        return {futures[future]: future.result() for future in as_completed(futures)}
+    
+    def _fetch_per_workspace(self, fetch, ws_names):
+        """对各工作空间并发调用fetch，返回{工作空间: 结果}"""
+        return self.fetch_many({name: (fetch, name) for name in ws_names})
+    
+    def get_all_styles_parallel(self, ws_names):
+        """并发获取多个工作空间的样式 {工作空间: 样式列表}，None表示全局样式"""
+        return self._fetch_per_workspace(self.get_styles, ws_names)
+    
+    def get_all_layers_parallel(self, ws_names):
+        """并发获取多个工作空间的图层 {工作空间: 图层列表}"""
+        return self._fetch_per_workspace(self.get_layers, ws_names)
+
+# ================== 视图模型 ==================
+
+class _TreeNode:
+    """树模型节点"""
+    __slots__ = ('parent', 'children', 'texts', 'payload', 'row')
+    
+    def __init__(self, texts=(), parent=None, payload=None):
+        self.parent = parent
+        self.children = []
+        self.texts = tuple(texts)
+        self.payload = payload
+        self.row = 0
+        if parent is not None:
+            self.row = len(parent.children)
+            parent.children.append(self)
+
+class _NodeTreeModel(QAbstractItemModel):
+    """只读树模型基类，视图只为可见行取数据"""
+    
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._root = _TreeNode()
+        
+    def _reset(self, root):
+        """替换整棵树并通知视图"""
+        self.beginResetModel()
+        self._root = root
+        self.endResetModel()
+        
+    def node(self, index):
+        """取索引对应的节点"""
+        return index.internalPointer() if index.isValid() else self._root
+        
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self.node(parent).children[row])
+        
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer().parent
+        if node is None or node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+        
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self.node(parent).children)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return len(self._headers)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            column = index.column()
+            return node.texts[column] if column < len(node.texts) else None
+        if role == Qt.ItemDataRole.UserRole:
+            return node.payload
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+class GeoServerTreeModel(_NodeTreeModel):
+    """GeoServer目录树模型：工作空间 → 数据存储/图层"""
+    
+    def __init__(self, parent=None):
+        super().__init__(["项目", "类型", "名称"], parent)
+        
+    def set_catalog(self, catalog):
+        """按目录列表重建树"""
+        root = _TreeNode()
+        
+        for workspace in catalog:
+            ws_name = workspace['name']
+            ws_node = _TreeNode((f"{ICON_FOLDER} {ws_name}", "工作空间", ws_name), root)
+            
+            # 数据存储
+            for datastore in workspace['datastores']:
+                ds_name = datastore.get('name', 'unknown')
+                _TreeNode((f"{ICON_DATABASE} {ds_name}", "数据存储", ds_name), ws_node)
+                
+            # 图层
+            for layer in workspace['layers']:
+                layer_name = layer.get('name', 'unknown')
+                _TreeNode((f"{ICON_MAP} {layer_name}", "图层", layer_name), ws_node)
+                
+        self._reset(root)
+
+class PostgresTreeModel(_NodeTreeModel):
+    """PostgreSQL数据库树模型：数据库 → 模式 → 表"""
+    
+    def __init__(self, parent=None):
+        super().__init__(["名称", "类型", "模式", "几何类型", "大小"], parent)
+        
+    def set_tables(self, db_name, tables):
+        """按表列表（已按模式排序）重建树，表节点的payload为完整表信息"""
+        root = _TreeNode()
+        db_node = _TreeNode((f"{ICON_DATABASE} {db_name}", "数据库"), root)
+        
+        # 查询结果已按模式、表名排序，直接分组
+        for schema_name, schema_tables in groupby(tables, key=itemgetter('table_schema')):
+            schema_node = _TreeNode((f"{ICON_FOLDER} {schema_name}", "模式", schema_name), db_node)
+            
+            for table in schema_tables:
+                is_spatial = table['is_spatial']
+                icon = ICON_SPATIAL if is_spatial else ICON_TABLE
+                _TreeNode((f"{icon} {table['table_name']}",
+                           "空间表" if is_spatial else "普通表",
+                           schema_name,
+                           table.get('geometry_type') or '',
+                           table.get('table_size') or '未知'),
+                          schema_node, payload=table)
+                
+        self._reset(root)
+
+class ScannedDataModel(QAbstractTableModel):
+    """扫描结果表格模型，直接读写scanned_data中的ScanItem"""
+    
+    _COLS = ('original_name', 'type', 'size', 'srs', 'new_name', 'style', 'feature_count')
+    _HEADERS = ("原始名称", "数据类型", "大小", "坐标系", "新名称", "样式", "要素数量")
+    # 可编辑列：坐标系、新名称、样式
+    _EDITABLE = frozenset(('srs', 'new_name', 'style'))
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        
+    def set_rows(self, rows):
+        """替换数据列表（共享引用，不复制）"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        
+    def append_rows(self, rows):
+        """在末尾追加数据行（原地扩展共享的数据列表）"""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+        
+    def column_changed(self, key):
+        """整列数据已在原地修改，通知视图一次性重绘该列"""
+        if not self._rows:
+            return
+        column = self._COLS.index(key)
+        self.dataChanged.emit(self.index(0, column), self.index(len(self._rows) - 1, column))
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._COLS)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            value = getattr(self._rows[index.row()], self._COLS[index.column()])
+            # 缺失的值（如未知要素数量）显示为空白
+            return '' if value is None else str(value)
+        return None
+        
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        key = self._COLS[index.column()]
+        if key not in self._EDITABLE:
+            return False
+        row = self._rows[index.row()]
+        current = getattr(row, key)
+        # 内容未变化时不规范化、不通知视图
+        if value == current:
+            return True
+        if key == 'new_name':
+            # 规范化名称
+            value = ImprovedDataScanner.normalize_name(value)
+            if value == current:
+                return True
+        setattr(row, key, value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+        
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and self._COLS[index.column()] in self._EDITABLE:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._HEADERS[section]
+        return None
+
+class RowTableModel(QAbstractTableModel):
+    """只读表格模型，每行是一个元组，整表替换时只重置一次"""
+    
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._rows = []
+        
+    def set_rows(self, rows):
+        """替换全部行"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
 
 class StyleDialog(QDialog):
     """样式选择对话框"""
@@ -1528,11 +2775,7 @@ class StyleDialog(QDialog):
         
         # 样式列表
         self.style_list = QListWidget()
-        self.style_list.addItem("default")
-        
-        for style in available_styles:
-            style_name = style.get('name', 'unknown')
-            self.style_list.addItem(style_name)
+        self.style_list.addItems(['default'] + [style.get('name', 'unknown') for style in available_styles])
             
         layout.addWidget(QLabel("选择样式:"))
         layout.addWidget(self.style_list)
@@ -1582,6 +2825,21 @@ class TableRenameDialog(QDialog):
 class ImprovedMainWindow(QMainWindow):
     """改进的主窗口"""
     
+    # 选项卡索引
+    TAB_GEOSERVER, TAB_POSTGRESQL, TAB_IMPORT, TAB_STYLE, TAB_LAYERS = range(5)
+    
+    # 样式列表超过此时长（秒）未更新时在后台刷新
+    STYLES_MAX_AGE = 300.0
+    
+    # 导入到PostgreSQL的最大并发数
+    IMPORT_MAX_WORKERS = 8
+    
+    # 扫描文件夹时向界面追加结果的最短间隔（秒）
+    SCAN_BATCH_INTERVAL = 0.2
+    
+    # 工作线程扫描到的一批数据项（跨线程发送，在GUI线程中追加到表格）
+    _scan_batch = pyqtSignal(list)
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("GeoServer & PostgreSQL 数据管理系统 V2.2")
@@ -1599,15 +2857,25 @@ class ImprovedMainWindow(QMainWindow):
         # 数据存储
         self.scanned_data = []
         self.available_styles = []
+        self._workspace_names = []
+        self._style_groups = []
+        self._styles_fetched_at = 0.0
+        
+        # 已构建内容的选项卡
+        self._built_tabs = set()
         
         # 当前活动的工作器
         self.current_worker = None
         
+        # 全局刷新中尚未完成的任务数
+        self._pending_refresh = 0
+        
         # 检查依赖
         self.check_dependencies()
         
         self.setup_ui()
         self.setup_style()
+        self._scan_batch.connect(self._on_folder_batch)
         
         self.logger.info("主窗口初始化完成")
         
@@ -1625,11 +2893,10 @@ class ImprovedMainWindow(QMainWindow):
             self.thread_manager.wait_for_all(5000)  # 等待5秒
             
             # 关闭数据库连接
-            if self.db_connection.connection:
-                try:
-                    self.db_connection.connection.close()
-                except:
-                    pass
+            try:
+                self.db_connection.close()
+            except:
+                pass
             
             self.logger.info("应用程序正常关闭")
             event.accept()
@@ -1638,80 +2905,28 @@ class ImprovedMainWindow(QMainWindow):
             self.logger.error(f"关闭应用程序时发生错误: {e}")
             event.accept()
         
+    def prewarm_connections(self):
+        """在后台预解析GeoServer主机名，首次连接时不必等待DNS"""
+        # 启动时只构建了GeoServer选项卡，PostgreSQL连接参数此时尚未创建
+        self._ensure_tab_built(self.TAB_GEOSERVER)
+        host = urlsplit(self.gs_url_edit.text().strip()).hostname
+        if host:
+            QThreadPool.globalInstance().start(partial(_resolve_host, host))
+        
     def check_dependencies(self):
         """检查依赖库"""
         if not HAS_SPATIAL_LIBS:
             QMessageBox.warning(self, "缺少依赖库", 
                 "缺少空间数据处理库，某些功能可能无法使用。\n\n"
                 "请安装以下库:\n"
-                "pip install geopandas fiona rasterio\n\n"
+                "pip install geopandas fiona rasterio pyogrio\n\n"
                 "注意：在Windows上可能需要先安装GDAL")
     
     def setup_style(self):
-        """设置样式"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-            QTabWidget::pane {
-                border: 1px solid #c0c0c0;
-                background-color: white;
-            }
-            QTabBar::tab {
-                padding: 8px 16px;
-                margin: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #4CAF50;
-                color: white;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                margin: 5px 0px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                padding: 6px 12px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                background-color: #f8f9fa;
-            }
-            QPushButton:hover {
-                background-color: #e9ecef;
-            }
-            QPushButton:pressed {
-                background-color: #dee2e6;
-            }
-            QPushButton:disabled {
-                background-color: #e9ecef;
-                color: #6c757d;
-            }
-            QLineEdit, QComboBox {
-                padding: 4px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-            }
-            QTreeWidget, QTableWidget {
-                border: 1px solid #ccc;
-                alternate-background-color: #f9f9f9;
-            }
-            QProgressBar {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 3px;
-            }
-        """)
+        """设置样式（应用到整个程序，只解析一次）"""
+        app = QApplication.instance()
+        if app.styleSheet() != _MAIN_STYLESHEET:
+            app.setStyleSheet(_MAIN_STYLESHEET)
         
     def setup_ui(self):
         """设置用户界面"""
@@ -1728,32 +2943,54 @@ class ImprovedMainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # 各个选项卡
-        self.setup_geoserver_tab()
-        self.setup_postgresql_tab()
-        self.setup_import_tab()
-        self.setup_style_tab()
-        self.setup_layers_tab()
+        # 各个选项卡先放空白占位页，首次切换到时再构建内容
+        self._tab_builders = [
+            (self.setup_geoserver_tab, f"{ICON_SERVER} GeoServer管理"),
+            (self.setup_postgresql_tab, f"{ICON_DATABASE} PostgreSQL管理"),
+            (self.setup_import_tab, f"{ICON_IMPORT} 数据导入"),
+            (self.setup_style_tab, f"{ICON_STYLE} 样式管理"),
+            (self.setup_layers_tab, f"{ICON_LAYERS} 图层管理"),
+        ]
+        for _, title in self._tab_builders:
+            self.tab_widget.addTab(QWidget(), title)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tab_widget.currentIndex())
         
         # 状态栏
         self.statusBar().showMessage("就绪")
         
+    def _ensure_tab_built(self, index):
+        """首次显示时构建选项卡内容"""
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        
+        builder, _ = self._tab_builders[index]
+        builder(self.tab_widget.widget(index))
+        
+        # 用已获取的数据补填新建的控件
+        self._fill_workspace_combos({index})
+        if index == self.TAB_STYLE:
+            self._fill_style_tree()
+        elif index == self.TAB_LAYERS:
+            self.refresh_published_layers()
+        
     def setup_toolbar(self, layout):
         """设置工具栏"""
         toolbar_layout = QHBoxLayout()
         
         # 日志按钮
-        self.log_btn = QPushButton(f"{get_icon('log')} 查看日志")
+        self.log_btn = QPushButton(f"{ICON_LOG} 查看日志")
         self.log_btn.clicked.connect(self.show_log_dialog)
         toolbar_layout.addWidget(self.log_btn)
         
         # 刷新按钮
-        self.global_refresh_btn = QPushButton(f"{get_icon('refresh')} 全局刷新")
+        self.global_refresh_btn = QPushButton(f"{ICON_REFRESH} 全局刷新")
         self.global_refresh_btn.clicked.connect(self.global_refresh)
         toolbar_layout.addWidget(self.global_refresh_btn)
         
         # 取消操作按钮
-        self.cancel_btn = QPushButton(f"{get_icon('cancel')} 取消操作")
+        self.cancel_btn = QPushButton(f"{ICON_CANCEL} 取消操作")
         self.cancel_btn.clicked.connect(self.cancel_current_operation)
         self.cancel_btn.setEnabled(False)
         toolbar_layout.addWidget(self.cancel_btn)
@@ -1770,24 +3007,53 @@ class ImprovedMainWindow(QMainWindow):
         dialog = LogViewDialog(self)
         dialog.show()
     
+    def run_async(self, fetch, on_done, *args, error_title=None):
+        """在线程池中执行fetch，完成后在GUI线程中调用on_done(结果)"""
+        worker = self.thread_manager.start_task(fetch, *args)
+        worker.result.connect(on_done)
+        if error_title:
+            worker.error.connect(
+                lambda msg: QMessageBox.critical(self, "错误", f"{error_title}失败: {msg}")
+            )
+        return worker
+    
     def global_refresh(self):
         """全局刷新"""
         try:
+            workers = []
             if self.gs_connection.connected:
-                self.refresh_geoserver_info()
-                self.refresh_workspaces()
-                self.refresh_styles()
-                self.refresh_published_layers()
-            
-            if self.db_connection.connection:
-                self.refresh_postgresql_info()
+                # 用户主动刷新时不使用缓存
+                self.gs_connection.refresh()
+                
+                # 各项刷新并发执行，结果回到GUI线程后分别填充
+                workers.append(self.refresh_geoserver_info())
+                workers.append(self.refresh_workspaces())
+                workers.append(self.refresh_styles())
+                workers.append(self.refresh_published_layers())
+            
+            if self.db_connection.connected:
+                self.db_connection.refresh()
+                workers.append(self.refresh_postgresql_info())
+            
+            workers = [w for w in workers if w is not None]
+            if not workers:
+                QMessageBox.information(self, "完成", "全局刷新完成")
+                return
             
-            QMessageBox.information(self, "完成", "全局刷新完成")
+            self._pending_refresh = len(workers)
+            for worker in workers:
+                worker.finished.connect(self._on_global_refresh_part)
             
         except Exception as e:
             log_manager.log_exception("全局刷新", e)
             QMessageBox.critical(self, "错误", f"全局刷新失败: {e}")
     
+    def _on_global_refresh_part(self, success, message):
+        """全局刷新的一项完成"""
+        self._pending_refresh -= 1
+        if self._pending_refresh == 0:
+            QMessageBox.information(self, "完成", "全局刷新完成")
+    
     def cancel_current_operation(self):
         """取消当前操作"""
         try:
@@ -1806,17 +3072,16 @@ class ImprovedMainWindow(QMainWindow):
     def update_connection_status(self):
         """更新连接状态"""
         gs_status = "🟢" if self.gs_connection.connected else "🔴"
-        pg_status = "🟢" if self.db_connection.connection else "🔴"
+        pg_status = "🟢" if self.db_connection.connected else "🔴"
         
         self.connection_status.setText(f"{gs_status} GeoServer | {pg_status} PostgreSQL")
     
-    def setup_geoserver_tab(self):
+    def setup_geoserver_tab(self, widget):
         """设置GeoServer选项卡"""
-        widget = QWidget()
         layout = QVBoxLayout(widget)
         
         # 连接设置
-        connection_group = QGroupBox(f"{get_icon('server')} GeoServer连接设置")
+        connection_group = QGroupBox(f"{ICON_SERVER} GeoServer连接设置")
         connection_layout = QFormLayout()
         
         self.gs_url_edit = QLineEdit("http://localhost:8080/geoserver")
@@ -1828,43 +3093,42 @@ class ImprovedMainWindow(QMainWindow):
         connection_layout.addRow("用户名:", self.gs_username_edit)
         connection_layout.addRow("密码:", self.gs_password_edit)
         
-        self.gs_connect_btn = QPushButton(f"{get_icon('connect')} 测试连接")
+        self.gs_connect_btn = QPushButton(f"{ICON_CONNECT} 测试连接")
         self.gs_connect_btn.clicked.connect(self.test_geoserver_connection)
         connection_layout.addRow(self.gs_connect_btn)
         
-        self.gs_status_label = QLabel(f"{get_icon('error')} 未连接")
+        self.gs_status_label = QLabel(f"{ICON_ERROR} 未连接")
         connection_layout.addRow("状态:", self.gs_status_label)
         
         connection_group.setLayout(connection_layout)
         layout.addWidget(connection_group)
         
         # 信息展示
-        info_group = QGroupBox(f"{get_icon('server')} GeoServer信息")
+        info_group = QGroupBox(f"{ICON_SERVER} GeoServer信息")
         info_layout = QVBoxLayout()
         
         # 刷新按钮
-        self.gs_refresh_btn = QPushButton(f"{get_icon('refresh')} 刷新信息")
+        self.gs_refresh_btn = QPushButton(f"{ICON_REFRESH} 刷新信息")
         self.gs_refresh_btn.clicked.connect(self.refresh_geoserver_info)
         self.gs_refresh_btn.setEnabled(False)
         info_layout.addWidget(self.gs_refresh_btn)
         
         # 信息树
-        self.gs_tree = QTreeWidget()
-        self.gs_tree.setHeaderLabels(["项目", "类型", "名称"])
+        self.gs_tree = QTreeView()
+        self.gs_tree.setUniformRowHeights(True)
+        self.gs_model = GeoServerTreeModel(self.gs_tree)
+        self.gs_tree.setModel(self.gs_model)
         info_layout.addWidget(self.gs_tree)
         
         info_group.setLayout(info_layout)
         layout.addWidget(info_group)
         
-        self.tab_widget.addTab(widget, f"{get_icon('server')} GeoServer管理")
-        
-    def setup_postgresql_tab(self):
+    def setup_postgresql_tab(self, widget):
         """设置PostgreSQL选项卡"""
-        widget = QWidget()
         layout = QVBoxLayout(widget)
         
         # 连接设置
-        connection_group = QGroupBox(f"{get_icon('database')} PostgreSQL连接设置")
+        connection_group = QGroupBox(f"{ICON_DATABASE} PostgreSQL连接设置")
         connection_layout = QFormLayout()
         
         self.pg_host_edit = QLineEdit("localhost")
@@ -1880,24 +3144,24 @@ class ImprovedMainWindow(QMainWindow):
         connection_layout.addRow("密码:", self.pg_password_edit)
         connection_layout.addRow("数据库:", self.pg_database_edit)
         
-        self.pg_connect_btn = QPushButton(f"{get_icon('connect')} 测试连接")
+        self.pg_connect_btn = QPushButton(f"{ICON_CONNECT} 测试连接")
         self.pg_connect_btn.clicked.connect(self.test_postgresql_connection)
         connection_layout.addRow(self.pg_connect_btn)
         
-        self.pg_status_label = QLabel(f"{get_icon('error')} 未连接")
+        self.pg_status_label = QLabel(f"{ICON_ERROR} 未连接")
         connection_layout.addRow("状态:", self.pg_status_label)
         
         connection_group.setLayout(connection_layout)
         layout.addWidget(connection_group)
         
         # 数据库信息
-        info_group = QGroupBox(f"{get_icon('database')} 数据库信息")
+        info_group = QGroupBox(f"{ICON_DATABASE} 数据库信息")
         info_layout = QVBoxLayout()
         
         # 操作按钮布局
         button_layout = QHBoxLayout()
         
-        self.pg_refresh_btn = QPushButton(f"{get_icon('refresh')} 刷新数据库")
+        self.pg_refresh_btn = QPushButton(f"{ICON_REFRESH} 刷新数据库")
         self.pg_refresh_btn.clicked.connect(self.refresh_postgresql_info)
         self.pg_refresh_btn.setEnabled(False)
         button_layout.addWidget(self.pg_refresh_btn)
@@ -1911,32 +3175,31 @@ class ImprovedMainWindow(QMainWindow):
         info_layout.addLayout(button_layout)
         
         # 数据库树
-        self.pg_tree = QTreeWidget()
-        self.pg_tree.setHeaderLabels(["名称", "类型", "模式", "几何类型", "大小"])
-        self.pg_tree.itemSelectionChanged.connect(self.on_table_selected)
+        self.pg_tree = QTreeView()
+        self.pg_tree.setUniformRowHeights(True)
+        self.pg_model = PostgresTreeModel(self.pg_tree)
+        self.pg_tree.setModel(self.pg_model)
+        self.pg_tree.selectionModel().selectionChanged.connect(self.on_table_selected)
         info_layout.addWidget(self.pg_tree)
         
         info_group.setLayout(info_layout)
         layout.addWidget(info_group)
         
-        self.tab_widget.addTab(widget, f"{get_icon('database')} PostgreSQL管理")
-        
-    def setup_import_tab(self):
+    def setup_import_tab(self, widget):
         """设置数据导入选项卡"""
-        widget = QWidget()
         layout = QVBoxLayout(widget)
         
         # 数据源选择
-        source_group = QGroupBox(f"{get_icon('import')} 数据源选择")
+        source_group = QGroupBox(f"{ICON_IMPORT} 数据源选择")
         source_layout = QVBoxLayout()
         
         # 导入类型
         type_layout = QHBoxLayout()
         self.import_type_group = QButtonGroup()
         
-        self.folder_radio = QRadioButton(f"{get_icon('folder')} 文件夹扫描")
+        self.folder_radio = QRadioButton(f"{ICON_FOLDER} 文件夹扫描")
         self.folder_radio.setChecked(True)
-        self.pg_radio = QRadioButton(f"{get_icon('database')} PostgreSQL数据库")
+        self.pg_radio = QRadioButton(f"{ICON_DATABASE} PostgreSQL数据库")
         
         self.import_type_group.addButton(self.folder_radio, 0)
         self.import_type_group.addButton(self.pg_radio, 1)
@@ -1950,7 +3213,7 @@ class ImprovedMainWindow(QMainWindow):
         # 路径选择
         path_layout = QHBoxLayout()
         self.source_path_edit = QLineEdit()
-        self.browse_btn = QPushButton(f"{get_icon('folder')} 浏览")
+        self.browse_btn = QPushButton(f"{ICON_FOLDER} 浏览")
         self.browse_btn.clicked.connect(self.browse_source)
         
         path_layout.addWidget(QLabel("数据源:"))
@@ -1960,7 +3223,7 @@ class ImprovedMainWindow(QMainWindow):
         source_layout.addLayout(path_layout)
         
         # 扫描按钮
-        self.scan_btn = QPushButton(f"{get_icon('refresh')} 扫描数据")
+        self.scan_btn = QPushButton(f"{ICON_REFRESH} 扫描数据")
         self.scan_btn.clicked.connect(self.scan_data)
         source_layout.addWidget(self.scan_btn)
         
@@ -1968,17 +3231,14 @@ class ImprovedMainWindow(QMainWindow):
         layout.addWidget(source_group)
         
         # 扫描结果
-        result_group = QGroupBox(f"{get_icon('file')} 扫描结果")
+        result_group = QGroupBox(f"{ICON_FILE} 扫描结果")
         result_layout = QVBoxLayout()
         
         # 数据表格
-        self.data_table = QTableWidget()
-        self.data_table.setColumnCount(7)
-        self.data_table.setHorizontalHeaderLabels([
-            "原始名称", "数据类型", "大小", "坐标系", "新名称", "样式", "要素数量"
-        ])
-        self.data_table.horizontalHeader().setStretchLastSection(True)
-        self.data_table.cellChanged.connect(self.on_cell_changed)
+        self.data_table = QTableView()
+        self.data_model = ScannedDataModel(self.data_table)
+        self.data_table.setModel(self.data_model)
+        fix_table_sizing(self.data_table, [200, 80, 90, 110, 200, 140, 90])
         result_layout.addWidget(self.data_table)
         
         # 批量操作按钮
@@ -1987,7 +3247,7 @@ class ImprovedMainWindow(QMainWindow):
         self.batch_rename_btn = QPushButton("✏️ 批量重命名")
         self.batch_rename_btn.clicked.connect(self.batch_rename)
         
-        self.batch_style_btn = QPushButton(f"{get_icon('style')} 批量设置样式")
+        self.batch_style_btn = QPushButton(f"{ICON_STYLE} 批量设置样式")
         self.batch_style_btn.clicked.connect(self.batch_set_style)
         
         batch_layout.addWidget(self.batch_rename_btn)
@@ -2005,7 +3265,7 @@ class ImprovedMainWindow(QMainWindow):
         self.workspace_combo = QComboBox()
         self.workspace_combo.setEditable(True)
         
-        self.refresh_workspace_btn = QPushButton(f"{get_icon('refresh')} 刷新")
+        self.refresh_workspace_btn = QPushButton(f"{ICON_REFRESH} 刷新")
         self.refresh_workspace_btn.clicked.connect(self.refresh_workspaces)
         
         workspace_layout.addWidget(QLabel("工作空间:"))
@@ -2019,13 +3279,13 @@ class ImprovedMainWindow(QMainWindow):
         # 操作按钮
         action_layout = QHBoxLayout()
         
-        self.import_pg_btn = QPushButton(f"{get_icon('database')} 导入到PostgreSQL")
+        self.import_pg_btn = QPushButton(f"{ICON_DATABASE} 导入到PostgreSQL")
         self.import_pg_btn.clicked.connect(self.import_to_postgresql)
         
-        self.publish_gs_btn = QPushButton(f"{get_icon('server')} 发布到GeoServer")
+        self.publish_gs_btn = QPushButton(f"{ICON_SERVER} 发布到GeoServer")
         self.publish_gs_btn.clicked.connect(self.publish_to_geoserver)
         
-        self.import_publish_btn = QPushButton(f"{get_icon('success')} 一键导入发布")
+        self.import_publish_btn = QPushButton(f"{ICON_SUCCESS} 一键导入发布")
         self.import_publish_btn.clicked.connect(self.import_and_publish)
         
         action_layout.addWidget(self.import_pg_btn)
@@ -2043,19 +3303,16 @@ class ImprovedMainWindow(QMainWindow):
         self.status_label = QLabel("就绪")
         layout.addWidget(self.status_label)
         
-        self.tab_widget.addTab(widget, f"{get_icon('import')} 数据导入")
-        
-    def setup_style_tab(self):
+    def setup_style_tab(self, widget):
         """设置样式管理选项卡"""
-        widget = QWidget()
         layout = QVBoxLayout(widget)
         
         # 样式导入
-        import_group = QGroupBox(f"{get_icon('style')} 样式导入")
+        import_group = QGroupBox(f"{ICON_STYLE} 样式导入")
         import_layout = QFormLayout()
         
         self.sld_path_edit = QLineEdit()
-        self.sld_browse_btn = QPushButton(f"{get_icon('folder')} 浏览")
+        self.sld_browse_btn = QPushButton(f"{ICON_FOLDER} 浏览")
         self.sld_browse_btn.clicked.connect(self.browse_sld_file)
         
         path_layout = QHBoxLayout()
@@ -2070,7 +3327,7 @@ class ImprovedMainWindow(QMainWindow):
         import_layout.addRow("样式名称:", self.style_name_edit)
         import_layout.addRow("工作空间:", self.style_workspace_combo)
         
-        self.import_style_btn = QPushButton(f"{get_icon('import')} 导入样式")
+        self.import_style_btn = QPushButton(f"{ICON_IMPORT} 导入样式")
         self.import_style_btn.clicked.connect(self.import_style)
         import_layout.addRow(self.import_style_btn)
         
@@ -2078,25 +3335,25 @@ class ImprovedMainWindow(QMainWindow):
         layout.addWidget(import_group)
         
         # 样式列表
-        list_group = QGroupBox(f"{get_icon('style')} 已有样式")
+        list_group = QGroupBox(f"{ICON_STYLE} 已有样式")
         list_layout = QVBoxLayout()
         
-        self.refresh_styles_btn = QPushButton(f"{get_icon('refresh')} 刷新样式")
+        self.refresh_styles_btn = QPushButton(f"{ICON_REFRESH} 刷新样式")
         self.refresh_styles_btn.clicked.connect(self.refresh_styles)
         list_layout.addWidget(self.refresh_styles_btn)
         
-        self.style_tree = QTreeWidget()
-        self.style_tree.setHeaderLabels(["样式名称", "工作空间", "文件名"])
+        self.style_tree = QTreeView()
+        self.style_tree.setRootIsDecorated(False)
+        self.style_tree.setUniformRowHeights(True)
+        self.style_model = RowTableModel(["样式名称", "工作空间", "文件名"], self.style_tree)
+        self.style_tree.setModel(self.style_model)
         list_layout.addWidget(self.style_tree)
         
         list_group.setLayout(list_layout)
         layout.addWidget(list_group)
         
-        self.tab_widget.addTab(widget, f"{get_icon('style')} 样式管理")
-        
-    def setup_layers_tab(self):
+    def setup_layers_tab(self, widget):
         """设置图层管理选项卡"""
-        widget = QWidget()
         layout = QVBoxLayout(widget)
         
         # 筛选控件
@@ -2106,10 +3363,10 @@ class ImprovedMainWindow(QMainWindow):
         self.workspace_filter_combo = QComboBox()
         self.layer_name_filter_edit = QLineEdit()
         
-        self.filter_btn = QPushButton(f"{get_icon('refresh')} 筛选")
+        self.filter_btn = QPushButton(f"{ICON_REFRESH} 筛选")
         self.filter_btn.clicked.connect(self.filter_layers)
         
-        self.refresh_layers_btn = QPushButton(f"{get_icon('refresh')} 刷新")
+        self.refresh_layers_btn = QPushButton(f"{ICON_REFRESH} 刷新")
         self.refresh_layers_btn.clicked.connect(self.refresh_published_layers)
         
         filter_layout.addWidget(QLabel("工作空间:"))
@@ -2124,21 +3381,19 @@ class ImprovedMainWindow(QMainWindow):
         layout.addWidget(filter_group)
         
         # 图层列表
-        layers_group = QGroupBox(f"{get_icon('layers')} 已发布图层")
+        layers_group = QGroupBox(f"{ICON_LAYERS} 已发布图层")
         layers_layout = QVBoxLayout()
         
-        self.layers_table = QTableWidget()
-        self.layers_table.setColumnCount(5)
-        self.layers_table.setHorizontalHeaderLabels([
+        self.layers_table = QTableView()
+        self.layers_model = RowTableModel([
             "图层名称", "工作空间", "样式", "数据源", "发布日期"
-        ])
-        self.layers_table.horizontalHeader().setStretchLastSection(True)
+        ], self.layers_table)
+        self.layers_table.setModel(self.layers_model)
+        fix_table_sizing(self.layers_table, [220, 140, 120, 100, 110])
         layers_layout.addWidget(self.layers_table)
         
         layers_group.setLayout(layers_layout)
         layout.addWidget(layers_group)
-        
-        self.tab_widget.addTab(widget, f"{get_icon('layers')} 图层管理")
     
     def enable_action_buttons(self, enabled):
         """启用/禁用操作按钮"""
@@ -2162,7 +3417,7 @@ class ImprovedMainWindow(QMainWindow):
             success, message = self.gs_connection.test_connection(url, username, password)
             
             if success:
-                self.gs_status_label.setText(f"{get_icon('success')} {message}")
+                self.gs_status_label.setText(f"{ICON_SUCCESS} {message}")
                 self.gs_refresh_btn.setEnabled(True)
                 self.update_connection_status()
                 QMessageBox.information(self, "成功", message)
@@ -2170,7 +3425,7 @@ class ImprovedMainWindow(QMainWindow):
                 self.refresh_workspaces()
                 self.refresh_styles()
             else:
-                self.gs_status_label.setText(f"{get_icon('error')} {message}")
+                self.gs_status_label.setText(f"{ICON_ERROR} {message}")
                 QMessageBox.critical(self, "错误", message)
                 
         except Exception as e:
@@ -2195,13 +3450,13 @@ class ImprovedMainWindow(QMainWindow):
             )
             
             if success:
-                self.pg_status_label.setText(f"{get_icon('success')} {message}")
+                self.pg_status_label.setText(f"{ICON_SUCCESS} {message}")
                 self.pg_refresh_btn.setEnabled(True)
                 self.update_connection_status()
                 QMessageBox.information(self, "成功", message)
                 self.refresh_postgresql_info()
             else:
-                self.pg_status_label.setText(f"{get_icon('error')} {message}")
+                self.pg_status_label.setText(f"{ICON_ERROR} {message}")
                 QMessageBox.critical(self, "错误", message)
                 
         except Exception as e:
@@ -2211,39 +3466,43 @@ class ImprovedMainWindow(QMainWindow):
     def refresh_geoserver_info(self):
         """刷新GeoServer信息"""
         if not self.gs_connection.connected:
-            return
+            return None
             
+        return self.run_async(self._fetch_geoserver_info, self._populate_geoserver_info,
+                              error_title="刷新GeoServer信息")
+    
+    def _fetch_geoserver_info(self):
+        """获取GeoServer目录（后台线程）"""
+        ws_names = [ws.get('name', 'unknown') for ws in self.gs_connection.get_workspaces()]
+        if not ws_names:
+            return []
+        
+        # 各工作空间的数据存储/图层请求一次并发发出
+        gs = self.gs_connection
+        calls = {}
+        for ws_name in ws_names:
+            calls[ws_name, 'datastores'] = (gs.get_datastores, ws_name)
+            calls[ws_name, 'layers'] = (gs.get_layers, ws_name)
+        results = gs.fetch_many(calls)
+        
+        # 保持工作空间原有顺序
+        return [{'name': name,
+                 'datastores': results[name, 'datastores'],
+                 'layers': results[name, 'layers']} for name in ws_names]
+    
+    def _refill_tree(self, tree, fill, *args, depth=None):
+        """冻结状态下填充树，最后一次性展开（depth为None时全部展开）"""
+        with frozen(tree):
+            fill(*args)
+            if depth is None:
+                tree.expandAll()
+            else:
+                tree.expandToDepth(depth)
+    
+    def _populate_geoserver_info(self, catalog):
+        """填充GeoServer目录树"""
         try:
-            self.gs_tree.clear()
-            
-            workspaces = self.gs_connection.get_workspaces()
-            
-            for workspace in workspaces:
-                ws_name = workspace.get('name', 'unknown')
-                ws_item = QTreeWidgetItem(self.gs_tree)
-                ws_item.setText(0, f"{get_icon('folder')} {ws_name}")
-                ws_item.setText(1, "工作空间")
-                ws_item.setText(2, ws_name)
-                
-                # 获取数据存储
-                datastores = self.gs_connection.get_datastores(ws_name)
-                for datastore in datastores:
-                    ds_name = datastore.get('name', 'unknown')
-                    ds_item = QTreeWidgetItem(ws_item)
-                    ds_item.setText(0, f"{get_icon('database')} {ds_name}")
-                    ds_item.setText(1, "数据存储")
-                    ds_item.setText(2, ds_name)
-                
-                # 获取图层
-                layers = self.gs_connection.get_layers(ws_name)
-                for layer in layers:
-                    layer_name = layer.get('name', 'unknown')
-                    layer_item = QTreeWidgetItem(ws_item)
-                    layer_item.setText(0, f"{get_icon('map')} {layer_name}")
-                    layer_item.setText(1, "图层")
-                    layer_item.setText(2, layer_name)
-                    
-            self.gs_tree.expandAll()
+            self._refill_tree(self.gs_tree, self.gs_model.set_catalog, catalog)
             
         except Exception as e:
             log_manager.log_exception("刷新GeoServer信息", e)
@@ -2251,82 +3510,44 @@ class ImprovedMainWindow(QMainWindow):
     
     def refresh_postgresql_info(self):
         """刷新PostgreSQL信息"""
-        if not self.db_connection.connection:
-            return
-            
+        if not self.db_connection.connected:
+            return None
+        
+        return self.run_async(self.db_connection.get_all_tables, self._populate_postgresql_info,
+                              error_title="刷新PostgreSQL信息")
+    
+    def _populate_postgresql_info(self, tables):
+        """填充PostgreSQL数据库树"""
         try:
-            self.pg_tree.clear()
-            
-            # 获取当前数据库信息
-            db_name = self.db_connection.params['database']
-            db_item = QTreeWidgetItem(self.pg_tree)
-            db_item.setText(0, f"{get_icon('database')} {db_name}")
-            db_item.setText(1, "数据库")
-            
-            # 获取所有表
-            tables = self.db_connection.get_all_tables()
-            schemas = {}
-            
-            # 按模式分组
-            for table in tables:
-                schema_name = table['table_schema']
-                if schema_name not in schemas:
-                    schemas[schema_name] = []
-                schemas[schema_name].append(table)
-            
-            # 创建模式节点
-            for schema_name, schema_tables in schemas.items():
-                schema_item = QTreeWidgetItem(db_item)
-                schema_item.setText(0, f"{get_icon('folder')} {schema_name}")
-                schema_item.setText(1, "模式")
-                schema_item.setText(2, schema_name)
-                
-                # 创建表节点
-                for table in schema_tables:
-                    table_name = table['table_name']
-                    is_spatial = table['is_spatial']
-                    geom_type = table.get('geometry_type', '')
-                    table_size = table.get('table_size', '未知')
-                    
-                    table_item = QTreeWidgetItem(schema_item)
-                    icon = get_icon('spatial') if is_spatial else get_icon('table')
-                    table_item.setText(0, f"{icon} {table_name}")
-                    table_item.setText(1, "空间表" if is_spatial else "普通表")
-                    table_item.setText(2, schema_name)
-                    table_item.setText(3, geom_type)
-                    table_item.setText(4, table_size)
-                    
-                    # 存储完整信息供重命名使用
-                    table_item.setData(0, Qt.ItemDataRole.UserRole, table)
-            
-            self.pg_tree.expandAll()
+            # 只展开数据库一级，模式节点保持折叠，表很多时不必布局全部行
+            self._refill_tree(self.pg_tree, self.pg_model.set_tables,
+                              self.db_connection.params['database'], tables, depth=0)
             
         except Exception as e:
             log_manager.log_exception("刷新PostgreSQL信息", e)
             QMessageBox.critical(self, "错误", f"刷新PostgreSQL信息失败: {str(e)}")
     
+    def _selected_pg_node(self):
+        """当前选中的数据库树节点"""
+        indexes = self.pg_tree.selectionModel().selectedRows()
+        return self.pg_model.node(indexes[0]) if indexes else None
+    
     def on_table_selected(self):
         """表选择变化时的处理"""
-        selected_items = self.pg_tree.selectedItems()
+        node = self._selected_pg_node()
         
         # 只有选中的是表时才启用重命名按钮
-        if selected_items:
-            item = selected_items[0]
-            item_type = item.text(1)
-            self.pg_rename_btn.setEnabled(item_type in ["空间表", "普通表"])
-        else:
-            self.pg_rename_btn.setEnabled(False)
+        self.pg_rename_btn.setEnabled(node is not None and node.payload is not None)
     
     def rename_table(self):
         """重命名表"""
         try:
-            selected_items = self.pg_tree.selectedItems()
-            if not selected_items:
+            node = self._selected_pg_node()
+            if node is None:
                 QMessageBox.warning(self, "警告", "请选择要重命名的表")
                 return
                 
-            item = selected_items[0]
-            table_data = item.data(0, Qt.ItemDataRole.UserRole)
+            table_data = node.payload
             
             if not table_data:
                 QMessageBox.warning(self, "警告", "无法获取表信息")
@@ -2343,24 +3564,17 @@ class ImprovedMainWindow(QMainWindow):
                     return
                     
                 # 验证新名称
-                #if not re.match(r'^[a-zA-Z][a-zA-Z0-9_]*, new_name):
-                if not re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', new_name):
+                if not _TABLE_NAME_RE.match(new_name):
                     QMessageBox.warning(self, "警告", "表名只能包含字母、数字和下划线，且必须以字母开头")
                     return
                 
-                # 执行重命名
-                pg_manager = ImprovedPostgreSQLManager(self.db_connection.params)
-                success, message = pg_manager.connect()
+                # 执行重命名（使用已建立的连接池）
+                success, message = self.db_connection.rename_table(current_name, new_name, schema_name)
                 if success:
-                    success, message = pg_manager.rename_table(current_name, new_name, schema_name)
-                    
-                    if success:
-                        QMessageBox.information(self, "成功", f"表已重命名为: {new_name}")
-                        self.refresh_postgresql_info()
-                    else:
-                        QMessageBox.critical(self, "错误", f"重命名失败: {message}")
+                    QMessageBox.information(self, "成功", f"表已重命名为: {new_name}")
+                    self.refresh_postgresql_info()
                 else:
-                    QMessageBox.critical(self, "错误", "数据库连接失败")
+                    QMessageBox.critical(self, "错误", f"重命名失败: {message}")
                     
         except Exception as e:
             log_manager.log_exception("重命名表", e)
@@ -2375,7 +3589,7 @@ class ImprovedMainWindow(QMainWindow):
                     self.source_path_edit.setText(folder)
                     log_manager.log_operation("选择数据源文件夹", folder, True)
             else:
-                if self.db_connection.connection:
+                if self.db_connection.connected:
                     self.source_path_edit.setText("当前PostgreSQL连接")
                 else:
                     QMessageBox.warning(self, "警告", "请先连接PostgreSQL数据库")
@@ -2386,7 +3600,7 @@ class ImprovedMainWindow(QMainWindow):
         """扫描数据"""
         try:
             self.scanned_data = []
-            self.data_table.setRowCount(0)
+            self.update_data_table()
             
             if self.folder_radio.isChecked():
                 self.scan_folder_data()
@@ -2396,6 +3610,13 @@ class ImprovedMainWindow(QMainWindow):
             log_manager.log_exception("扫描数据", e)
             QMessageBox.critical(self, "错误", f"扫描数据失败: {e}")
     
+    def _start_scan(self, fetch, on_done, *args, error_title=None):
+        """后台执行扫描，期间禁用扫描按钮"""
+        self.scan_btn.setEnabled(False)
+        worker = self.run_async(fetch, on_done, *args, error_title=error_title)
+        worker.finished.connect(lambda *_: self.scan_btn.setEnabled(True))
+        return worker
+    
     def scan_folder_data(self):
         """扫描文件夹数据"""
         try:
@@ -2407,99 +3628,105 @@ class ImprovedMainWindow(QMainWindow):
             if not HAS_SPATIAL_LIBS:
                 QMessageBox.critical(self, "错误", "缺少空间数据处理库，无法扫描数据")
                 return
-                
-            scanner = ImprovedDataScanner()
-            self.scanned_data = scanner.scan_folder(folder_path)
-            self.update_data_table()
             
-            log_manager.log_operation("扫描文件夹", f"{folder_path}, 找到 {len(self.scanned_data)} 个文件", True)
-            QMessageBox.information(self, "完成", 
-                f"扫描完成，共找到 {len(self.scanned_data)} 个空间数据文件")
+            self._start_scan(self._scan_folder, self._on_folder_scanned, folder_path,
+                             error_title="扫描文件夹")
                 
         except Exception as e:
             log_manager.log_exception("扫描文件夹数据", e)
             QMessageBox.critical(self, "错误", f"扫描文件夹失败: {str(e)}")
     
+    def _scan_folder(self, folder_path):
+        """在工作线程中扫描文件夹，扫描到的数据项分批送回GUI线程，返回(路径, 数据项数)"""
+        scanner = ImprovedDataScanner()
+        count = 0
+        batch = []
+        last_emit = time.monotonic()
+        try:
+            self.logger.info(f"开始扫描文件夹: {folder_path}")
+            for data_item in scanner.iter_folder(folder_path):
+                batch.append(data_item)
+                now = time.monotonic()
+                if now - last_emit >= self.SCAN_BATCH_INTERVAL:
+                    self._scan_batch.emit(batch)
+                    count += len(batch)
+                    batch = []
+                    last_emit = now
+            if batch:
+                self._scan_batch.emit(batch)
+                count += len(batch)
+            self.logger.info(f"扫描完成，找到 {count} 个空间数据文件")
+            return folder_path, count
+        finally:
+            scanner.close()
+    
+    def _on_folder_batch(self, items):
+        """追加一批扫描结果（GUI线程）"""
+        self.data_model.append_rows(items)
+    
+    def _on_folder_scanned(self, result):
+        """文件夹扫描完成（GUI线程），数据项已由_on_folder_batch逐批加入"""
+        folder_path, _ = result
+        
+        log_manager.log_operation("扫描文件夹", f"{folder_path}, 找到 {len(self.scanned_data)} 个文件", True)
+        QMessageBox.information(self, "完成", 
+            f"扫描完成，共找到 {len(self.scanned_data)} 个空间数据文件")
+    
     def scan_postgresql_data(self):
         """扫描PostgreSQL数据"""
         try:
-            if not self.db_connection.connection:
+            if not self.db_connection.connected:
                 QMessageBox.warning(self, "警告", "请先连接PostgreSQL数据库")
                 return
-                
-            spatial_tables = self.db_connection.get_spatial_tables()
-            
-            self.scanned_data = []
-            for table in spatial_tables:
-                schema_name = table['table_schema']
-                table_name = table['table_name']
-                geom_type = table.get('geometry_type', '')
-                srid = table.get('srid', 4326)
-                size = table.get('table_size', '未知')
-                
-                full_name = f"{schema_name}.{table_name}"
-                
-                self.scanned_data.append({
-                    'original_name': full_name,
-                    'path': full_name,
-                    'type': "空间表",
-                    'size': size,
-                    'srs': f"EPSG:{srid}" if srid else "未知",
-                    'new_name': table_name,
-                    'style': 'default',
-                    'geometry_type': geom_type,
-                    'feature_count': table.get('column_count', '未知'),
-                    'extent': None
-                })
-            
-            self.update_data_table()
             
-            log_manager.log_operation("扫描PostgreSQL数据", f"找到 {len(self.scanned_data)} 个空间表", True)
-            QMessageBox.information(self, "完成",
-                f"扫描完成，共找到 {len(self.scanned_data)} 个空间数据表")
+            self._start_scan(self._scan_postgresql, self._on_postgresql_scanned,
+                             error_title="扫描PostgreSQL数据")
                 
         except Exception as e:
             log_manager.log_exception("扫描PostgreSQL数据", e)
             QMessageBox.critical(self, "错误", f"扫描PostgreSQL数据失败: {str(e)}")
     
+    def _scan_postgresql(self):
+        """在工作线程中查询空间表并生成数据项"""
+        items = []
+        for table in self.db_connection.get_spatial_tables():
+            schema_name = table['table_schema']
+            table_name = table['table_name']
+            geom_type = table.get('geometry_type', '')
+            srid = table.get('srid', 4326)
+            size = table.get('table_size', '未知')
+            
+            full_name = f"{schema_name}.{table_name}"
+            
+            items.append(ScanItem(
+                original_name=full_name,
+                path=full_name,
+                type="空间表",
+                size=size,
+                srs=f"EPSG:{srid}" if srid else "未知",
+                new_name=table_name,
+                geometry_type=geom_type,
+                feature_count=table.get('column_count', '未知')
+            ))
+        return items
+    
+    def _on_postgresql_scanned(self, items):
+        """PostgreSQL扫描完成（GUI线程）"""
+        self.scanned_data = items
+        self.update_data_table()
+        
+        log_manager.log_operation("扫描PostgreSQL数据", f"找到 {len(self.scanned_data)} 个空间表", True)
+        QMessageBox.information(self, "完成",
+            f"扫描完成，共找到 {len(self.scanned_data)} 个空间数据表")
+    
     def update_data_table(self):
         """更新数据表格"""
         try:
-            self.data_table.setRowCount(len(self.scanned_data))
-            
-            for row, data in enumerate(self.scanned_data):
-                self.data_table.setItem(row, 0, QTableWidgetItem(data['original_name']))
-                self.data_table.setItem(row, 1, QTableWidgetItem(data['type']))
-                self.data_table.setItem(row, 2, QTableWidgetItem(data['size']))
-                self.data_table.setItem(row, 3, QTableWidgetItem(data['srs']))
-                self.data_table.setItem(row, 4, QTableWidgetItem(data['new_name']))
-                self.data_table.setItem(row, 5, QTableWidgetItem(data['style']))
-                self.data_table.setItem(row, 6, QTableWidgetItem(str(data.get('feature_count', ''))))
+            with frozen(self.data_table):
+                self.data_model.set_rows(self.scanned_data)
         except Exception as e:
             log_manager.log_exception("更新数据表格", e)
     
-    def on_cell_changed(self, row, column):
-        """单元格内容改变时同步到数据"""
-        try:
-            if 0 <= row < len(self.scanned_data):
-                item = self.data_table.item(row, column)
-                if item:
-                    value = item.text()
-                    
-                    if column == 3:  # 坐标系
-                        self.scanned_data[row]['srs'] = value
-                    elif column == 4:  # 新名称
-                        # 规范化名称
-                        normalized = ImprovedDataScanner.normalize_name(value)
-                        self.scanned_data[row]['new_name'] = normalized
-                        # 更新表格显示
-                        if normalized != value:
-                            item.setText(normalized)
-                    elif column == 5:  # 样式
-                        self.scanned_data[row]['style'] = value
-        except Exception as e:
-            log_manager.log_exception("单元格内容变化", e)
-    
     def batch_rename(self):
         """批量重命名"""
         try:
@@ -2533,11 +3760,11 @@ class ImprovedMainWindow(QMainWindow):
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 prefix = prefix_edit.text().strip()
                 if prefix:
-                    for i, data in enumerate(self.scanned_data):
-                        new_name = f"{prefix}_{data['new_name']}"
-                        self.scanned_data[i]['new_name'] = ImprovedDataScanner.normalize_name(new_name)
+                    normalize = ImprovedDataScanner.normalize_name
+                    for data in self.scanned_data:
+                        data.new_name = normalize(f"{prefix}_{data.new_name}")
                     
-                    self.update_data_table()
+                    self.data_model.column_changed('new_name')
                     log_manager.log_operation("批量重命名", f"前缀: {prefix}", True)
                     QMessageBox.information(self, "成功", "批量重命名完成")
         except Exception as e:
@@ -2551,14 +3778,18 @@ class ImprovedMainWindow(QMainWindow):
                 QMessageBox.warning(self, "警告", "没有扫描到数据")
                 return
                 
+            # 对话框使用已缓存的样式列表，过期时在后台刷新供下次使用
+            if time.monotonic() - self._styles_fetched_at > self.STYLES_MAX_AGE:
+                self.refresh_styles()
+            
             dialog = StyleDialog(self.available_styles, self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 selected_style = dialog.get_selected_style()
                 
-                for i, data in enumerate(self.scanned_data):
-                    self.scanned_data[i]['style'] = selected_style
+                for data in self.scanned_data:
+                    data.style = selected_style
                 
-                self.update_data_table()
+                self.data_model.column_changed('style')
                 log_manager.log_operation("批量设置样式", selected_style, True)
                 QMessageBox.information(self, "成功", "批量样式设置完成")
         except Exception as e:
@@ -2568,24 +3799,33 @@ class ImprovedMainWindow(QMainWindow):
     def refresh_workspaces(self):
         """刷新工作空间"""
         if not self.gs_connection.connected:
-            return
+            return None
             
+        return self.run_async(self.gs_connection.get_workspaces, self._populate_workspaces)
+    
+    def _populate_workspaces(self, workspaces):
+        """填充工作空间下拉框"""
         try:
-            workspaces = self.gs_connection.get_workspaces()
-            workspace_names = [ws.get('name', '') for ws in workspaces]
-            
-            self.workspace_combo.clear()
-            self.workspace_combo.addItems(workspace_names)
-            
-            self.style_workspace_combo.clear()
-            self.style_workspace_combo.addItems([''] + workspace_names)
-            
-            self.workspace_filter_combo.clear()
-            self.workspace_filter_combo.addItems([''] + workspace_names)
+            self._workspace_names = [ws.get('name', '') for ws in workspaces]
+            self._fill_workspace_combos(self._built_tabs)
             
         except Exception as e:
             log_manager.log_exception("刷新工作空间", e)
     
+    def _fill_workspace_combos(self, tabs):
+        """填充指定选项卡中的工作空间下拉框（未构建的选项卡跳过）"""
+        workspace_names = self._workspace_names
+        optional_names = [''] + workspace_names
+        
+        if self.TAB_IMPORT in tabs:
+            set_combo_items(self.workspace_combo, workspace_names)
+        
+        if self.TAB_STYLE in tabs:
+            set_combo_items(self.style_workspace_combo, optional_names)
+        
+        if self.TAB_LAYERS in tabs:
+            set_combo_items(self.workspace_filter_combo, optional_names)
+    
     def import_to_postgresql(self):
         """导入数据到PostgreSQL"""
         try:
@@ -2593,7 +3833,7 @@ class ImprovedMainWindow(QMainWindow):
                 QMessageBox.warning(self, "警告", "请先扫描数据")
                 return
                 
-            if not self.db_connection.connection:
+            if not self.db_connection.connected:
                 QMessageBox.warning(self, "警告", "请先连接PostgreSQL数据库")
                 return
             
@@ -2611,64 +3851,109 @@ class ImprovedMainWindow(QMainWindow):
             # 禁用操作按钮
             self.enable_action_buttons(False)
             
+            # 在GUI线程中取快照，工作线程只读这份列表
+            items = list(self.scanned_data)
+            total_count = len(items)
+            
+            # 按类型一次分组；已在数据库中的空间表直接计为成功，未知类型不导入
+            groups = {"矢量数据": [], "栅格数据": [], "空间表": []}
+            for item in items:
+                group = groups.get(item.type)
+                if group is not None:
+                    group.append(item)
+            skipped_count = len(groups["空间表"])
+            workers = max(1, min(self.IMPORT_MAX_WORKERS, total_count - skipped_count))
+            
+            def import_one(import_file, item):
+                """用指定的导入函数导入单个数据项（工作线程），返回(是否成功, 错误信息)"""
+                if self.current_worker and self.current_worker.is_cancelled():
+                    return False, None
+                
+                table_name = item.new_name
+                try:
+                    srid_text = item.srs
+                    target_crs = srid_text if srid_text.startswith('EPSG:') else 'EPSG:4326'
+                    
+                    success, message = import_file(item.path, table_name, target_crs=target_crs)
+                    return success, None if success else f"{table_name}: {message}"
+                    
+                except Exception as e:
+                    self.logger.error(f"导入 {table_name} 失败: {e}")
+                    return False, f"{table_name}: {str(e)}"
+            
             # 创建工作线程
             def import_task():
+                if not _ensure_spatial():
+                    return False, "空间数据处理库导入失败"
+                # 每个导入线程从连接池借用独立连接
+                pg_manager = ImprovedPostgreSQLManager(self.db_connection.params, maxconn=workers + 1)
                 try:
-                    pg_manager = ImprovedPostgreSQLManager(self.db_connection.params)
                     success, message = pg_manager.connect()
                     if not success:
                         return False, f"数据库连接失败: {message}"
                     
-                    success_count = 0
-                    total_count = len(self.scanned_data)
+                    success_count = done_count = skipped_count
                     errors = []
+                    worker = self.current_worker
                     
-                    for i, item in enumerate(self.scanned_data):
-                        # 检查取消状态
-                        if self.current_worker and self.current_worker.is_cancelled():
-                            return False, "操作已取消"
-                        
-                        # 更新进度
-                        progress = int((i / total_count) * 100)
-                        if self.current_worker:
-                            self.current_worker.progress.emit(progress)
-                            self.current_worker.status.emit(f"正在导入: {item['new_name']}")
+                    # 大文件按批次汇报进度：{id(正在导入的数据项): 已完成比例}
+                    progress_lock = threading.Lock()
+                    fractions = {}
+                    
+                    def report_overall():
+                        if worker:
+                            with progress_lock:
+                                value = (done_count + sum(fractions.values())) * 100 // total_count
+                            worker.report_progress(value)
+                    
+                    def batch_progress(item, done, total):
+                        # 要素总数未知时只按文件计进度
+                        if not total:
+                            return
+                        with progress_lock:
+                            fractions[id(item)] = min(done / total, 1.0)
+                        report_overall()
+                    
+                    is_cancelled = worker.is_cancelled if worker else None
+                    jobs = [(partial(pg_manager.import_vector_file, use_copy=True,
+                                     progress_callback=partial(batch_progress, item),
+                                     is_cancelled=is_cancelled), item)
+                            for item in groups["矢量数据"]]
+                    jobs.extend((pg_manager.import_raster_file, item) for item in groups["栅格数据"])
+                    
+                    # 目标表相同的数据项按原顺序串行导入，避免并发DROP/CREATE同一张表
+                    by_table = {}
+                    for job in jobs:
+                        by_table.setdefault(job[1].new_name, []).append(job)
+                    
+                    def import_group(group):
+                        return [(item,) + import_one(import_file, item) for import_file, item in group]
+                    
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = [executor.submit(import_group, group) for group in by_table.values()]
                         
-                        try:
-                            file_path = item['path']
-                            table_name = item['new_name']
-                            data_type = item['type']
-                            srid_text = item.get('srs', 'EPSG:4326')
-                            target_crs = srid_text if srid_text.startswith('EPSG:') else 'EPSG:4326'
-                            
-                            if data_type == "矢量数据":
-                                success, message = pg_manager.import_vector_file(
-                                    file_path, table_name, target_crs=target_crs
-                                )
-                                if success:
+                        for future in as_completed(futures):
+                            for item, ok, error in future.result():
+                                with progress_lock:
+                                    fractions.pop(id(item), None)
+                                    done_count += 1
+                                if ok:
                                     success_count += 1
-                                else:
-                                    errors.append(f"{table_name}: {message}")
-                                    
-                            elif data_type == "栅格数据":
-                                success, message = pg_manager.import_raster_file(
-                                    file_path, table_name, target_crs=target_crs
-                                )
-                                if success:
-                                    success_count += 1
-                                else:
-                                    errors.append(f"{table_name}: {message}")
-                                    
-                            elif data_type == "空间表":
-                                # 已在数据库中，跳过
-                                success_count += 1
+                                elif error:
+                                    errors.append(error)
                                 
-                        except Exception as e:
-                            errors.append(f"{item['new_name']}: {str(e)}")
-                            self.logger.error(f"导入 {item['new_name']} 失败: {e}")
+                                # 进度通过信号回到GUI线程
+                                report_overall()
+                                if worker:
+                                    worker.report_status(f"已导入: {item.new_name} ({done_count}/{total_count})")
+                            
+                            # 取消时丢弃尚未开始的任务
+                            if worker and worker.is_cancelled():
+                                executor.shutdown(wait=True, cancel_futures=True)
+                                return False, "操作已取消"
                     
-                    if self.current_worker:
-                        self.current_worker.progress.emit(100)
+                    if worker:
+                        worker.report_progress(100)
                     
                     result_message = f"导入完成: 成功 {success_count}/{total_count}"
                     if errors:
@@ -2678,6 +3963,8 @@ class ImprovedMainWindow(QMainWindow):
                     
                 except Exception as e:
                     return False, f"导入过程中发生错误: {str(e)}"
+                finally:
+                    pg_manager.close()
             
             # 启动导入任务
             self.current_worker = self.thread_manager.start_task(import_task)
@@ -2719,7 +4006,7 @@ class ImprovedMainWindow(QMainWindow):
                 QMessageBox.warning(self, "警告", "请先连接GeoServer")
                 return
                 
-            if not self.db_connection.connection:
+            if not self.db_connection.connected:
                 QMessageBox.warning(self, "警告", "请先连接PostgreSQL数据库")
                 return
             
@@ -2740,32 +4027,35 @@ class ImprovedMainWindow(QMainWindow):
             
             # 创建工作线程
             def publish_task():
+                if not _ensure_spatial():
+                    return False, "空间数据处理库导入失败"
                 try:
-                    # 创建批处理器
-                    gs_config = {
-                        'base_url': self.gs_connection.base_url,
-                        'username': self.gs_connection.username,
-                        'password': self.gs_connection.password
-                    }
-                    
-                    processor = ImprovedBatchProcessor(self.db_connection.params, gs_config)
+                    # 创建批处理器（复用当前连接的发布器），取消状态跟随当前工作器
+                    worker = self.current_worker
+                    processor = ImprovedBatchProcessor(
+                        self.db_connection.params, gs_publisher=self.gs_connection.publisher,
+                        is_cancelled=worker.is_cancelled if worker else None
+                    )
                     
                     def progress_callback(value):
                         if self.current_worker:
-                            self.current_worker.progress.emit(value)
+                            self.current_worker.report_progress(value)
                     
-                    def status_callback(status):
+                    def status_callback(status, force=False):
                         if self.current_worker:
-                            self.current_worker.status.emit(status)
+                            self.current_worker.report_status(status, force)
                     
                     # 执行批量发布
-                    success, message = processor.process_data_items(
-                        self.scanned_data,
-                        workspace,
-                        f"{workspace}_datastore",
-                        progress_callback,
-                        status_callback
-                    )
+                    try:
+                        success, message = processor.process_data_items(
+                            self.scanned_data,
+                            workspace,
+                            f"{workspace}_datastore",
+                            progress_callback,
+                            status_callback
+                        )
+                    finally:
+                        processor.close()
                     
                     return success, message
                     
@@ -2789,6 +4079,9 @@ class ImprovedMainWindow(QMainWindow):
             self.current_worker = None
             self.enable_action_buttons(True)
             
+            # 批处理可能已部分写入，无论成败都让工作空间/图层缓存失效
+            self.gs_connection.invalidate_cache()
+            
             if success:
                 QMessageBox.information(self, "成功", message)
                 # 刷新GeoServer和图层信息
@@ -2809,7 +4102,7 @@ class ImprovedMainWindow(QMainWindow):
                 QMessageBox.warning(self, "警告", "请先扫描数据")
                 return
                 
-            if not self.db_connection.connection:
+            if not self.db_connection.connected:
                 QMessageBox.warning(self, "警告", "请先连接PostgreSQL数据库")
                 return
                 
@@ -2839,32 +4132,35 @@ class ImprovedMainWindow(QMainWindow):
             
             # 创建工作线程
             def import_publish_task():
+                if not _ensure_spatial():
+                    return False, "空间数据处理库导入失败"
                 try:
-                    # 创建批处理器
-                    gs_config = {
-                        'base_url': self.gs_connection.base_url,
-                        'username': self.gs_connection.username,
-                        'password': self.gs_connection.password
-                    }
-                    
-                    processor = ImprovedBatchProcessor(self.db_connection.params, gs_config)
+                    # 创建批处理器（复用当前连接的发布器），取消状态跟随当前工作器
+                    worker = self.current_worker
+                    processor = ImprovedBatchProcessor(
+                        self.db_connection.params, gs_publisher=self.gs_connection.publisher,
+                        is_cancelled=worker.is_cancelled if worker else None
+                    )
                     
                     def progress_callback(value):
                         if self.current_worker:
-                            self.current_worker.progress.emit(value)
+                            self.current_worker.report_progress(value)
                     
-                    def status_callback(status):
+                    def status_callback(status, force=False):
                         if self.current_worker:
-                            self.current_worker.status.emit(status)
+                            self.current_worker.report_status(status, force)
                     
                     # 执行一键导入发布
-                    success, message = processor.process_data_items(
-                        self.scanned_data,
-                        workspace,
-                        f"{workspace}_datastore",
-                        progress_callback,
-                        status_callback
-                    )
+                    try:
+                        success, message = processor.process_data_items(
+                            self.scanned_data,
+                            workspace,
+                            f"{workspace}_datastore",
+                            progress_callback,
+                            status_callback
+                        )
+                    finally:
+                        processor.close()
                     
                     return success, message
                     
@@ -2888,6 +4184,9 @@ class ImprovedMainWindow(QMainWindow):
             self.current_worker = None
             self.enable_action_buttons(True)
             
+            # 批处理可能已部分写入，无论成败都让工作空间/图层缓存失效
+            self.gs_connection.invalidate_cache()
+            
             if success:
                 QMessageBox.information(self, "成功", message)
                 # 刷新所有相关信息
@@ -2937,19 +4236,11 @@ class ImprovedMainWindow(QMainWindow):
                 QMessageBox.warning(self, "警告", "请先连接GeoServer")
                 return
             
-            # 读取SLD文件内容
-            with open(sld_path, 'r', encoding='utf-8') as f:
-                sld_content = f.read()
-            
-            # 创建GeoServer发布器
-            gs_publisher = ImprovedGeoServerPublisher(
-                self.gs_connection.base_url,
-                self.gs_connection.username,
-                self.gs_connection.password
-            )
+            # 读取SLD文件字节（不解码，重复导入同一文件时不再读盘）
+            sld_content = read_sld_bytes(sld_path)
             
-            # 上传样式
-            success, message = gs_publisher.upload_style(
+            # 上传样式（复用当前连接的发布器）
+            success, message = self.gs_connection.publisher.upload_style(
                 style_name, sld_content, workspace if workspace else None
             )
             
@@ -2970,102 +4261,113 @@ class ImprovedMainWindow(QMainWindow):
     def refresh_styles(self):
         """刷新样式"""
         if not self.gs_connection.connected:
-            return
-            
+            return None
+        
+        return self.run_async(self._fetch_styles, self._populate_styles)
+    
+    def _fetch_styles(self):
+        """获取全局和各工作空间样式（后台线程）"""
+        ws_names = [ws.get('name', '') for ws in self.gs_connection.get_workspaces()]
+        
+        # 全局样式与各工作空间样式一起并发获取
+        styles = self.gs_connection.get_all_styles_parallel([None] + ws_names)
+        
+        style_groups = [('全局', styles[None])]
+        style_groups.extend((ws_name, styles[ws_name]) for ws_name in ws_names)
+        return style_groups
+    
+    def _populate_styles(self, style_groups):
+        """填充样式树"""
         try:
-            self.style_tree.clear()
+            self._style_groups = style_groups
+            self._styles_fetched_at = time.monotonic()
             self.available_styles = []
             
-            # 获取全局样式
-            global_styles = self.gs_connection.get_styles()
-            for style in global_styles:
-                style_name = style.get('name', 'unknown')
-                style_info = {
-                    'name': style_name,
-                    'workspace': '全局',
-                    'filename': style.get('filename', '')
-                }
-                self.available_styles.append(style_info)
-                
-                item = QTreeWidgetItem(self.style_tree)
-                item.setText(0, style_name)
-                item.setText(1, '全局')
-                item.setText(2, style.get('filename', ''))
-            
-            # 获取工作空间样式
-            workspaces = self.gs_connection.get_workspaces()
-            for workspace in workspaces:
-                ws_name = workspace.get('name', '')
-                ws_styles = self.gs_connection.get_styles(ws_name)
-                
-                for style in ws_styles:
+            for ws_name, styles in style_groups:
+                for style in styles:
                     style_name = style.get('name', 'unknown')
                     style_info = {
-                        'name': f"{ws_name}:{style_name}",
+                        'name': style_name if ws_name == '全局' else f"{ws_name}:{style_name}",
                         'workspace': ws_name,
                         'filename': style.get('filename', '')
                     }
                     self.available_styles.append(style_info)
-                    
-                    item = QTreeWidgetItem(self.style_tree)
-                    item.setText(0, style_name)
-                    item.setText(1, ws_name)
-                    item.setText(2, style.get('filename', ''))
+            
+            if self.TAB_STYLE in self._built_tabs:
+                self._fill_style_tree()
                     
         except Exception as e:
             log_manager.log_exception("刷新样式", e)
     
+    def _fill_style_tree(self):
+        """按最近一次获取的样式填充样式树"""
+        rows = [
+            (style.get('name', 'unknown'), ws_name, style.get('filename', ''))
+            for ws_name, styles in self._style_groups
+            for style in styles
+        ]
+        with frozen(self.style_tree):
+            self.style_model.set_rows(rows)
+    
     def filter_layers(self):
         """筛选图层"""
         self.refresh_published_layers()
     
     def refresh_published_layers(self):
         """刷新已发布图层"""
-        if not self.gs_connection.connected:
-            return
-            
+        # 图层选项卡尚未构建时跳过，构建时会自动刷新
+        if not self.gs_connection.connected or self.TAB_LAYERS not in self._built_tabs:
+            return None
+        
+        # 筛选条件在GUI线程读取
+        workspace_filter = self.workspace_filter_combo.currentText()
+        layer_filter = self.layer_name_filter_edit.text().strip()
+        
+        return self.run_async(self._fetch_published_layers, self._populate_published_layers,
+                              workspace_filter, layer_filter, error_title="刷新图层")
+    
+    def _fetch_published_layers(self, workspace_filter, layer_filter):
+        """获取符合筛选条件的图层 [(图层名, 工作空间)]（后台线程）"""
+        ws_names = [ws.get('name', '') for ws in self.gs_connection.get_workspaces()]
+        
+        # 应用工作空间筛选
+        if workspace_filter:
+            ws_names = [name for name in ws_names if name == workspace_filter]
+        
+        layers = self.gs_connection.get_all_layers_parallel(ws_names)
+        
+        rows = [
+            (layer.get('name', ''), ws_name)
+            for ws_name in ws_names
+            for layer in layers[ws_name]
+        ]
+        
+        # 应用图层名称筛选（忽略大小写的子串匹配，不必逐个转小写）
+        if layer_filter:
+            search = re.compile(re.escape(layer_filter), re.IGNORECASE).search
+            rows = [row for row in rows if search(row[0])]
+        return rows
+    
+    def _populate_published_layers(self, rows):
+        """填充已发布图层表格"""
         try:
-            self.layers_table.setRowCount(0)
-            
-            workspaces = self.gs_connection.get_workspaces()
-            workspace_filter = self.workspace_filter_combo.currentText()
-            layer_filter = self.layer_name_filter_edit.text().strip().lower()
-            
-            row = 0
-            for workspace in workspaces:
-                ws_name = workspace.get('name', '')
-                
-                # 应用工作空间筛选
-                if workspace_filter and workspace_filter != ws_name:
-                    continue
-                
-                layers = self.gs_connection.get_layers(ws_name)
-                for layer in layers:
-                    layer_name = layer.get('name', '')
-                    
-                    # 应用图层名称筛选
-                    if layer_filter and layer_filter not in layer_name.lower():
-                        continue
-                    
-                    self.layers_table.insertRow(row)
-                    self.layers_table.setItem(row, 0, QTableWidgetItem(layer_name))
-                    self.layers_table.setItem(row, 1, QTableWidgetItem(ws_name))
-                    self.layers_table.setItem(row, 2, QTableWidgetItem("默认样式"))
-                    self.layers_table.setItem(row, 3, QTableWidgetItem("PostGIS"))
-                    self.layers_table.setItem(row, 4, QTableWidgetItem(
-                        datetime.now().strftime("%Y-%m-%d")
-                    ))
-                    row += 1
+            # 整次刷新共用同一个日期字符串
+            today_str = datetime.now().strftime("%Y-%m-%d")
+            table_rows = [
+                (layer_name, ws_name, _LAYER_STYLE_TEXT, _LAYER_SOURCE_TEXT, today_str)
+                for layer_name, ws_name in rows
+            ]
+            
+            # 整表一次重置，不逐格插入
+            with frozen(self.layers_table):
+                self.layers_model.set_rows(table_rows)
                     
         except Exception as e:
             log_manager.log_exception("刷新已发布图层", e)
             QMessageBox.critical(self, "错误", f"刷新图层失败: {str(e)}")
 
-def create_default_styles():
-    """创建默认样式"""
-    
-    styles = {
-        'default_point': '''<?xml version="1.0" encoding="UTF-8"?>
+# 默认样式SLD（模块导入时生成一次，上传时直接发送bytes）
+_DEFAULT_POINT_SLD = b'''<?xml version="1.0" encoding="UTF-8"?>
 <StyledLayerDescriptor version="1.0.0" xmlns="http://www.opengis.net/sld">
   <NamedLayer>
     <Name>default_point</Name>
@@ -3093,9 +4395,9 @@ def create_default_styles():
       </FeatureTypeStyle>
     </UserStyle>
   </NamedLayer>
-</StyledLayerDescriptor>''',
+</StyledLayerDescriptor>'''
 
-        'default_line': '''<?xml version="1.0" encoding="UTF-8"?>
+_DEFAULT_LINE_SLD = b'''<?xml version="1.0" encoding="UTF-8"?>
 <StyledLayerDescriptor version="1.0.0" xmlns="http://www.opengis.net/sld">
   <NamedLayer>
     <Name>default_line</Name>
@@ -3114,9 +4416,9 @@ def create_default_styles():
       </FeatureTypeStyle>
     </UserStyle>
   </NamedLayer>
-</StyledLayerDescriptor>''',
+</StyledLayerDescriptor>'''
 
-        'default_polygon': '''<?xml version="1.0" encoding="UTF-8"?>
+_DEFAULT_POLYGON_SLD = b'''<?xml version="1.0" encoding="UTF-8"?>
 <StyledLayerDescriptor version="1.0.0" xmlns="http://www.opengis.net/sld">
   <NamedLayer>
     <Name>default_polygon</Name>
@@ -3140,9 +4442,16 @@ def create_default_styles():
     </UserStyle>
   </NamedLayer>
 </StyledLayerDescriptor>'''
-    }
-    
-    return styles
+
+DEFAULT_STYLES = MappingProxyType({
+    'default_point': _DEFAULT_POINT_SLD,
+    'default_line': _DEFAULT_LINE_SLD,
+    'default_polygon': _DEFAULT_POLYGON_SLD,
+})
+
+def create_default_styles():
+    """创建默认样式（返回只读映射，值为SLD字节）"""
+    return DEFAULT_STYLES
 
 def main():
     """主函数"""
@@ -3154,8 +4463,10 @@ def main():
         
         # 设置应用程序图标和信息
         app.setApplicationName("GeoServer & PostgreSQL 数据管理系统")
-        app.setApplicationVersion("2.2")
+        app.setApplicationVersion(APP_VERSION)
         app.setOrganizationName("GIS Development Team")
+        app.aboutToQuit.connect(lambda: logger.info("应用程序退出"))
+        app.aboutToQuit.connect(log_manager.shutdown)
         
         # 记录应用启动
         logger.info("应用程序启动")
@@ -3181,18 +4492,23 @@ def main():
             "• 完整的操作日志记录\n"
             "• 安全的线程管理和任务取消\n\n"
             "使用前请确保已安装空间数据处理库:\n"
-            "pip install geopandas fiona rasterio"
+            "pip install geopandas fiona rasterio pyogrio"
         )
         
-        QMessageBox.information(window, "欢迎", startup_message)
+        # 非模态显示，不阻塞事件循环
+        welcome = QMessageBox(QMessageBox.Icon.Information, "欢迎", startup_message,
+                              QMessageBox.StandardButton.Ok, window)
+        welcome.setWindowModality(Qt.WindowModality.NonModal)
+        welcome.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        welcome.show()
+        
+        # 用户阅读欢迎信息时在后台预热连接
+        window.prewarm_connections()
         
         logger.info("应用程序界面显示完成")
         
         # 运行应用
-        result = app.exec()
-        
-        logger.info("应用程序退出")
-        return result
+        return app.exec()
         
     except Exception as e:
         logger.error(f"应用程序启动失败: {e}")